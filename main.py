@@ -1,5 +1,6 @@
 import os
 import subprocess
+import threading
 from pathlib import Path
 
 ROOT = Path(__file__).parent.resolve()
@@ -19,25 +20,43 @@ def process_xml(config_xml: str) -> str:
     # run process
     python_path = ROOT / '.venv' / 'Scripts' / 'python.exe'
 
-    try:
-        process = subprocess.run(
-            [
-                python_path,
-                'run.py',
-                '--config',
-                config_xml,
-            ],
-            capture_output=True,
-            creationflags=subprocess.CREATE_NO_WINDOW,
-            text=True,
-            check=True,
-            cwd=ROOT,
-            env=env,
+    process = subprocess.Popen(
+        [
+            python_path,
+            'run.py',
+            '--config',
+            config_xml,
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        creationflags=subprocess.CREATE_NO_WINDOW,
+        text=True,
+        cwd=ROOT,
+        env=env,
+    )
+
+    # drain stderr (log records) in background to avoid blocking of the process on full pipe
+    stderr = []
+    thread = threading.Thread(
+        target=lambda: stderr.append(process.stderr.read()),
+        daemon=True,
+    )
+    thread.start()
+
+    # the process closes stdout as soon as the report is printed
+    stdout = process.stdout.read().strip()
+
+    process.wait()
+    thread.join()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode,
+            process.args,
+            output=stdout,
+            stderr=''.join(stderr),
         )
-        return process.stdout.strip()
 
-    except subprocess.CalledProcessError:
-        raise
+    return stdout
 
 
 if __name__ == '__main__':
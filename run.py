@@ -1,9 +1,12 @@
 import logging
+import os
+import sys
 from argparse import ArgumentParser
 
 import plugin
 from plugin import Plugin
 from plugin.config import PLUGIN_CONFIG
+from plugin.diagnostics import PROFILER
 from plugin.loggers import *
 from plugin.types import XML
 
@@ -12,6 +15,16 @@ LOGGER = logging.getLogger('plugin-absorption-correction')
 PLUGIN = Plugin.create()
 
 
+def close_stdout() -> None:
+    """Close stdout (replace it by `os.devnull`) to signal the caller that the report is printed."""
+
+    sys.stdout.flush()
+
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+
+
 def process_xml(config_xml: XML) -> str:
 
     LOGGER.info('run %r', plugin.__name__)
@@ -30,7 +43,11 @@ if __name__ == '__main__':
     )
     args = parser.parse_args()
 
-    result = process_xml(
-        config_xml=args.config,
-    )
-    print(result)
+    with PROFILER.profile():  # the report is dumped by `flush` in another thread
+        result = process_xml(
+            config_xml=args.config,
+        )
+        print(result, flush=True)
+        close_stdout()
+
+        PLUGIN.flush()
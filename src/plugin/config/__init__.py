@@ -1,6 +1,6 @@
-from .plugin_config import PluginConfig, PLUGIN_CONFIG
+from .plugin_config import PluginConfig, PLUGIN_CONFIG, ProfileMode
 
 
 __all__ = [
-    PluginConfig, PLUGIN_CONFIG,
+    PluginConfig, PLUGIN_CONFIG, ProfileMode,
 ]
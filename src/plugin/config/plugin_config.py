@@ -15,11 +15,50 @@ class LoggingLevel(Enum):
     ERROR = 'ERROR'
 
 
+class ProfileMode(Enum):
+
+    NONE = 'none'
+    CPROFILE = 'cprofile'
+    SAMPLING = 'sampling'
+
+
 class PluginConfig(BaseSettings):
 
     logging_level: LoggingLevel = Field(LoggingLevel.INFO, alias='LOGGING_LEVEL')
+    logging_queue_size: int = Field(10_000, alias='LOGGING_QUEUE_SIZE')
+    logging_max_bytes: int = Field(10 * 2**20, alias='LOGGING_MAX_BYTES')
+    logging_backup_count: int = Field(5, alias='LOGGING_BACKUP_COUNT')
+    logging_max_age: float = Field(30, alias='LOGGING_MAX_AGE')
     black_name: str = Field('', alias='BLACK_NAME')
 
+    lookup_table: bool = Field(False, alias='LOOKUP_TABLE')
+    lookup_table_tolerance: float = Field(1e-4, alias='LOOKUP_TABLE_TOLERANCE')
+
+    linearize_transients: bool = Field(False, alias='LINEARIZE_TRANSIENTS')
+    linearize_chunk_size: int = Field(2**22, alias='LINEARIZE_CHUNK_SIZE')
+
+    polynom_tolerance: float = Field(0, alias='POLYNOM_TOLERANCE')
+    preview_fps: int = Field(60, alias='PREVIEW_FPS')
+    preview_lod_threshold: int = Field(10_000, alias='PREVIEW_LOD_THRESHOLD')
+
+    latency: bool = Field(False, alias='LATENCY')
+    latency_filepath: str = Field('', alias='LATENCY_FILEPATH')
+    trace: bool = Field(False, alias='TRACE')
+    trace_filepath: str = Field('trace.json', alias='TRACE_FILEPATH')
+    metrics_journal: bool = Field(False, alias='METRICS_JOURNAL')
+    metrics_journal_filepath: str = Field('metrics.jsonl', alias='METRICS_JOURNAL_FILEPATH')
+    metrics_journal_size: int = Field(10 * 2**20, alias='METRICS_JOURNAL_SIZE')
+    memory_profile: bool = Field(False, alias='MEMORY_PROFILE')
+    memory_profile_top: int = Field(10, alias='MEMORY_PROFILE_TOP')
+    profile: ProfileMode = Field(ProfileMode.NONE, alias='PROFILE')
+    profile_event_loop: bool = Field(False, alias='PROFILE_EVENT_LOOP')
+    profile_interval: float = Field(.005, alias='PROFILE_INTERVAL')
+
+    compact_report: bool = Field(False, alias='COMPACT_REPORT')
+    incremental_report: bool = Field(False, alias='INCREMENTAL_REPORT')
+    report_history_dir: str = Field('history', alias='REPORT_HISTORY_DIR')
+    report_history_size: int = Field(0, alias='REPORT_HISTORY_SIZE')
+
     model_config = SettingsConfigDict(
         env_file='.env',
         env_file_encoding='utf-8',
@@ -0,0 +1,13 @@
+import numpy as np
+
+from spectrumlab.types import Array
+
+
+RELATIVE_FLOOR = 1e-3
+
+
+def estimate_error(y_hat: Array[float], y: Array[float], fp: Array[float]) -> Array[float]:
+    """Estimate relative error of `y_hat` (the error of values close to zero is relative to the maximum of `fp`)."""
+    floor = RELATIVE_FLOOR * np.max(np.abs(fp))
+
+    return np.abs(y_hat - y) / np.maximum(np.abs(y), floor)
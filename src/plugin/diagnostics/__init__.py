@@ -0,0 +1,15 @@
+from .latency import LATENCY, LatencyRecorder
+from .memory import MEMORY, MemoryProfiler
+from .profiling import PROFILER, Profiler
+from .tracing import TRACER, Tracer
+
+__all__ = [
+    LATENCY,
+    LatencyRecorder,
+    MEMORY,
+    MemoryProfiler,
+    PROFILER,
+    Profiler,
+    TRACER,
+    Tracer,
+]
@@ -0,0 +1,172 @@
+import json
+import logging
+import math
+import os
+from argparse import ArgumentParser
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
+
+from plugin.config import PLUGIN_CONFIG
+from plugin.dto import AtomData
+
+
+LOGGER = logging.getLogger('plugin-absorption-correction')
+
+PERCENTILES = (50, 90, 99)
+
+
+def create_record(
+    atom_data: AtomData,
+    durations: Mapping[str, float],
+    peak_rss: int | None = None,
+    cache_hits: int = 0,
+) -> Mapping[str, Any]:
+    """Create record of run's metrics (`durations` are to be taken when all spans of the run are closed)."""
+
+    probes, parallels = set(), set()
+    for datum in atom_data.data.values():
+        probes.update(datum.frame.index.get_level_values(0))
+        parallels.update(datum.frame.index)
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'version': get_version('plugin'),
+        'spectrumlab_version': get_version('spectrumlab'),
+        'input_size': get_size(atom_data.filepath),
+        'n_columns': len(atom_data.data),
+        'n_probes': len(probes),
+        'n_parallels': len(parallels),
+        'durations': dict(durations),
+        'session': durations.get('retrieve'),
+        'peak_rss': peak_rss,
+        'cache_hits': cache_hits,
+    }
+
+
+def write_record(
+    record: Mapping[str, Any],
+    filepath: str,
+    max_size: int,
+) -> None:
+    """Append `record` to journal. Journal is rotated to `filepath.1`, if its size exceeds `max_size`."""
+
+    line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+    try:
+        if os.path.exists(filepath) and (os.path.getsize(filepath) + len(line) > max_size):
+            os.replace(filepath, filepath + '.1')
+
+        with open(filepath, 'ab') as file:
+            file.write(line)
+    except OSError as error:
+        LOGGER.warning('Write metrics journal failed: %r', error)
+
+
+def read_records(filepath: str) -> list[Mapping[str, Any]]:
+    """Read records of journal (with rotated one)."""
+
+    records = []
+    for path in (filepath + '.1', filepath):
+        if not os.path.exists(path):
+            continue
+
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+    return records
+
+
+def aggregate_records(
+    records: Sequence[Mapping[str, Any]],
+    by: str | None = None,
+) -> Mapping[str, Mapping[str, Mapping[str, float]]]:
+    """Aggregate per-phase durations (and session, peak RSS) of `records` to percentiles, grouped `by` given key."""
+
+    values = defaultdict(lambda: defaultdict(list))
+    for record in records:
+        group = str(record.get(by)) if by else 'all'
+
+        metrics = {
+            **record.get('durations', {}),
+            'session': record.get('session'),
+            'peak_rss': record.get('peak_rss'),
+        }
+        for name, value in metrics.items():
+            if value is not None:
+                values[group][name].append(value)
+
+    return {
+        group: {
+            name: {
+                'n': len(items),
+                **{'p{}'.format(q): calculate_percentile(items, q) for q in PERCENTILES},
+            }
+            for name, items in sorted(metrics.items())
+        }
+        for group, metrics in values.items()
+    }
+
+
+def calculate_percentile(values: Sequence[float], q: float) -> float:
+    """Calculate `q` percentile of `values` (nearest rank)."""
+
+    if not values:
+        return math.nan
+
+    values = sorted(values)
+    rank = max(math.ceil(q / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def get_version(name: str) -> str | None:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def get_size(filepath: str) -> int | None:
+    try:
+        return os.path.getsize(filepath)
+    except OSError:
+        return None
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = ArgumentParser(
+        prog='python -m plugin.diagnostics.journal',
+        description='Aggregate metrics journal into percentiles per phase.',
+    )
+    parser.add_argument(
+        'filepath',
+        nargs='?',
+        default=PLUGIN_CONFIG.metrics_journal_filepath,
+        help='filepath to metrics journal',
+    )
+    parser.add_argument(
+        '--by',
+        choices=['version', 'spectrumlab_version'],
+        default=None,
+        help='group runs by key',
+    )
+    args = parser.parse_args(argv)
+
+    records = read_records(args.filepath)
+    for group, metrics in aggregate_records(records, by=args.by).items():
+        print('{} ({} runs)'.format(group, max(item['n'] for item in metrics.values())))
+        print('  {:<24}{:>6}{:>12}{:>12}{:>12}'.format('phase', 'n', 'p50', 'p90', 'p99'))
+        for name, item in metrics.items():
+            print('  {:<24}{:>6}{:>12.4g}{:>12.4g}{:>12.4g}'.format(
+                name, item['n'], item['p50'], item['p90'], item['p99'],
+            ))
+
+
+if __name__ == '__main__':
+    main()
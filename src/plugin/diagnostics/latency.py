@@ -0,0 +1,139 @@
+import json
+import logging
+import math
+import time
+from bisect import bisect_right
+from collections.abc import Hashable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+
+from plugin.config import PLUGIN_CONFIG
+
+
+LOGGER = logging.getLogger('plugin-absorption-correction')
+
+EDGES = tuple(10**(i / 20) for i in range(-80, 21))  # from .1 ms to 10 s (20 bins per decade), in seconds
+PERCENTILES = (50, 90, 99)
+
+
+class LatencyHistogram:
+    """Histogram of latencies with log-spaced bins."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(EDGES) + 1)
+        self.n = 0
+        self.total = 0.
+        self.min = math.inf
+        self.max = 0.
+
+    def add(self, elapsed: float) -> None:
+        self.counts[bisect_right(EDGES, elapsed)] += 1
+        self.n += 1
+        self.total += elapsed
+        self.min = min(self.min, elapsed)
+        self.max = max(self.max, elapsed)
+
+    def percentile(self, q: float) -> float:
+        """Estimate `q` percentile (by upper edge of the bin)."""
+
+        if self.n == 0:
+            return math.nan
+
+        rank = q / 100 * self.n
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(EDGES[i], self.max) if i < len(EDGES) else self.max
+        return self.max
+
+    def summary(self) -> Mapping[str, float]:
+        return {
+            'n': self.n,
+            'mean': self.total / self.n if self.n else math.nan,
+            'min': self.min if self.n else math.nan,
+            'max': self.max,
+            **{
+                'p{}'.format(q): self.percentile(q)
+                for q in PERCENTILES
+            },
+        }
+
+
+class LatencyRecorder:
+    """Record latencies of interactions (from mouse event to completed redraw) and of long operations."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self._started: dict[Hashable, dict[str, float]] = {}
+
+    def record(self, name: str, elapsed: float) -> None:
+        if name not in self.histograms:
+            self.histograms[name] = LatencyHistogram()
+        self.histograms[name].add(elapsed)
+
+    def start(self, owner: Hashable, name: str) -> None:
+        """Start interaction `name` of `owner` (the earliest start of coalesced events is kept)."""
+
+        if not self.enabled:
+            return None
+
+        self._started.setdefault(owner, {}).setdefault(name, time.perf_counter())
+
+    def stop(self, owner: Hashable) -> None:
+        """Stop all started interactions of `owner` (on completed redraw)."""
+
+        if not self.enabled:
+            return None
+
+        started = self._started.pop(owner, None)
+        if not started:
+            return None
+
+        stopped_at = time.perf_counter()
+        for name, started_at in started.items():
+            self.record(name, stopped_at - started_at)
+
+    def measure(self, name: str) -> AbstractContextManager[None]:
+        """Measure elapsed time of block."""
+
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(name)
+
+    def summary(self) -> Mapping[str, Mapping[str, float]]:
+        return {
+            name: histogram.summary()
+            for name, histogram in sorted(self.histograms.items())
+        }
+
+    def dump(self, filepath: str | None = None) -> None:
+        """Write summary of latencies to the log (and to JSON `filepath`, if given)."""
+
+        if not self.enabled or not self.histograms:
+            return None
+
+        summary = self.summary()
+        for name, values in summary.items():
+            LOGGER.info(
+                'Latency of %s (n=%d): p50 %.4f, p90 %.4f, p99 %.4f, max %.4f, s',
+                name, values['n'], values['p50'], values['p90'], values['p99'], values['max'],
+            )
+
+        if filepath:
+            with open(filepath, 'w', encoding='utf-8') as file:
+                json.dump(summary, file, indent=2)
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started_at)
+
+
+LATENCY = LatencyRecorder(
+    enabled=PLUGIN_CONFIG.latency,
+)
@@ -0,0 +1,196 @@
+import atexit
+import ctypes
+import logging
+import os
+import sys
+import tracemalloc
+from collections.abc import Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any
+
+from plugin.config import PLUGIN_CONFIG
+
+
+LOGGER = logging.getLogger('plugin-absorption-correction')
+
+MB = 2**20
+
+
+@dataclass
+class MemoryRecord:
+    name: str
+    attributes: Mapping[str, Any]
+    peak: int  # peak of traced memory over the start of phase, in bytes
+    delta: int  # retained traced memory, in bytes
+    rss_delta: int | None
+    top: list[tuple[str, int]] = field(default_factory=list)
+
+
+class MemoryProfiler:
+    """Track `tracemalloc` peak, retained memory and RSS deltas of phases (nested phases are allowed)."""
+
+    def __init__(self, enabled: bool = False, n_top: int = 10) -> None:
+        self.enabled = enabled
+        self.n_top = n_top
+
+        self.records: list[MemoryRecord] = []
+        self._peaks: list[int] = []  # peaks of enclosing phases
+
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def measure(self, name: str, **attributes: Any) -> AbstractContextManager[None]:
+        """Measure memory of block."""
+
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(name, attributes)
+
+    def summary(self) -> Mapping[str, Mapping[str, float]]:
+        summary = {}
+        for record in self.records:
+            item = summary.setdefault(record.name, {'n': 0, 'peak': 0, 'delta': 0})
+            item['n'] += 1
+            item['peak'] = max(item['peak'], record.peak)
+            item['delta'] += record.delta
+
+        return summary
+
+    def dump(self) -> None:
+        """Write summary of phases to the log."""
+
+        if not self.enabled or not self.records:
+            return None
+
+        for name, values in self.summary().items():
+            LOGGER.info(
+                'Memory of %s (n=%d): peak %.1f, retained %.1f, MB',
+                name, values['n'], values['peak'] / MB, values['delta'] / MB,
+            )
+
+    @contextmanager
+    def _measure(self, name: str, attributes: dict[str, Any]) -> Iterator[None]:
+
+        snapshot = take_snapshot()
+        rss = get_rss()
+
+        # propagate the peak of enclosing phase before reset
+        current, peak = tracemalloc.get_traced_memory()
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)
+        tracemalloc.reset_peak()
+
+        self._peaks.append(current)
+        try:
+            yield
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(self._peaks.pop(), peak)
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+
+            stats = take_snapshot().compare_to(snapshot, 'lineno')
+            record = MemoryRecord(
+                name=name,
+                attributes=attributes,
+                peak=peak - current,
+                delta=sum(stat.size_diff for stat in stats),
+                rss_delta=None if rss is None else get_rss() - rss,
+                top=[
+                    (str(stat.traceback[0]), stat.size_diff)
+                    for stat in stats[:self.n_top]
+                    if stat.size_diff > 0
+                ],
+            )
+            self.records.append(record)
+            log_record(record)
+
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ])
+
+
+def log_record(record: MemoryRecord) -> None:
+    LOGGER.info(
+        'Memory of %s%s: peak %.1f, retained %.1f, RSS %s, MB',
+        record.name,
+        ''.join(' {}={!r}'.format(key, value) for key, value in record.attributes.items()),
+        record.peak / MB,
+        record.delta / MB,
+        'n/a' if record.rss_delta is None else '{:+.1f}'.format(record.rss_delta / MB),
+    )
+    for site, size in record.top:
+        LOGGER.info('    %10.1f KB: %s', size / 2**10, site)
+
+
+def get_rss() -> int | None:
+    """Get current resident set size (working set on Windows) of the process, in bytes."""
+
+    if sys.platform == 'win32':
+        counters = _get_process_memory_counters()
+        return None if counters is None else counters.WorkingSetSize
+
+    try:
+        with open('/proc/self/statm', 'r') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_peak_rss() -> int | None:
+    """Get peak resident set size (peak working set on Windows) of the process, in bytes."""
+
+    if sys.platform == 'win32':
+        counters = _get_process_memory_counters()
+        return None if counters is None else counters.PeakWorkingSetSize
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else 1024 * peak
+
+
+class ProcessMemoryCounters(ctypes.Structure):
+    _fields_ = [
+        ('cb', ctypes.c_ulong),
+        ('PageFaultCount', ctypes.c_ulong),
+        ('PeakWorkingSetSize', ctypes.c_size_t),
+        ('WorkingSetSize', ctypes.c_size_t),
+        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+        ('PagefileUsage', ctypes.c_size_t),
+        ('PeakPagefileUsage', ctypes.c_size_t),
+    ]
+
+
+def _get_process_memory_counters() -> ProcessMemoryCounters | None:
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+
+    try:
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+    except (AttributeError, OSError):
+        return None
+
+    return counters
+
+
+MEMORY = MemoryProfiler(
+    enabled=PLUGIN_CONFIG.memory_profile,
+    n_top=PLUGIN_CONFIG.memory_profile_top,
+)
+if PLUGIN_CONFIG.memory_profile:
+    atexit.register(MEMORY.dump)
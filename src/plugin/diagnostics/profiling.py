@@ -0,0 +1,224 @@
+import cProfile
+import hashlib
+import logging
+import os
+import sys
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from datetime import datetime
+from types import FrameType
+
+from plugin.config import PLUGIN_CONFIG, ProfileMode
+
+
+LOGGER = logging.getLogger('plugin-absorption-correction')
+
+
+class CProfileCollector:
+    """Deterministic profiler (`.prof` file, open in `snakeviz` or `pstats`).
+
+    Since Python 3.12 `cProfile` is based on `sys.monitoring`, so calls of all threads are profiled.
+    """
+
+    suffix = '.prof'
+
+    def __init__(self) -> None:
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+
+    def write(self, filepath: str) -> None:
+        self._profile.dump_stats(filepath)
+
+
+class SamplingCollector:
+    """Sample stacks of all threads every `interval` (collapsed stacks prefixed by thread's name, open in speedscope).
+
+    With the GIL the sampler thread gets control no more often than `sys.getswitchinterval()` (5 ms by default)
+    while other threads are busy, so the effective interval is not less than the switch interval.
+    """
+
+    suffix = '.collapsed'
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._sample,
+            name='plugin-sampling-profiler',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def write(self, filepath: str) -> None:
+        with open(filepath, 'w', encoding='utf-8') as file:
+            for stack, count in self.stacks.most_common():
+                file.write('{} {}\n'.format(stack, count))
+
+    def _sample(self) -> None:
+        sampler_id = threading.get_ident()
+        main_id = threading.main_thread().ident
+
+        while not self._stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_id:
+                    continue
+                if thread_id != main_id and is_idle(frame):  # skip idle workers of executors
+                    continue
+
+                self.stacks['{};{}'.format(names.get(thread_id, thread_id), collapse_stack(frame))] += 1
+
+
+def is_idle(frame: FrameType) -> bool:
+    """Whether thread of `frame` is waiting (for a lock, a queue's item or a condition)."""
+
+    return os.path.basename(frame.f_code.co_filename) in ('threading.py', 'queue.py')
+
+
+def collapse_stack(frame: FrameType | None) -> str:
+    """Collapse stack of `frame` to `outer;...;inner` line."""
+
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append('{} ({}:{})'.format(code.co_name, os.path.basename(code.co_filename), code.co_firstlineno))
+        frame = frame.f_back
+
+    return ';'.join(reversed(names))
+
+
+class Profile:
+    """Profile of a run. Written on exit to `profile_<hash>_<timestamp><suffix>`, where hash is of the `filepath`."""
+
+    def __init__(self, collector: CProfileCollector | SamplingCollector) -> None:
+        self.collector = collector
+
+        self.filepath = None  # filepath to input data
+        self.active = False
+        self._started_at = datetime.now()
+
+    def __enter__(self) -> 'Profile':
+        self.collector.start()
+        self.active = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.collector.stop()
+        self.active = False
+
+        filepath = 'profile_{}_{}{}'.format(
+            hash_file(self.filepath) if self.filepath else 'unknown',
+            self._started_at.strftime('%Y%m%d-%H%M%S'),
+            self.collector.suffix,
+        )
+        try:
+            self.collector.write(filepath)
+        except OSError as error:
+            LOGGER.warning('Write profile failed: %r', error)
+        else:
+            LOGGER.info('Profile is written to: %r', filepath)
+
+
+class NullProfile:
+    """Profile of disabled profiler."""
+
+    filepath = None
+
+    def __enter__(self) -> 'NullProfile':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+
+class Profiler:
+    """Profile runs of the plugin (with or without Qt event loop) by `cProfile` or by sampling of stacks."""
+
+    def __init__(
+        self,
+        mode: ProfileMode = ProfileMode.NONE,
+        event_loop: bool = False,
+        interval: float = .005,
+    ) -> None:
+        self.mode = mode
+        self.event_loop = event_loop
+        self.interval = interval
+
+        self._profile = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != ProfileMode.NONE
+
+    def profile(self) -> Profile | NullProfile:
+        if not self.enabled:
+            return NullProfile()
+
+        match self.mode:
+            case ProfileMode.CPROFILE:
+                collector = CProfileCollector()
+            case ProfileMode.SAMPLING:
+                collector = SamplingCollector(interval=self.interval)
+
+        self._profile = Profile(collector)
+        return self._profile
+
+    def set_filepath(self, filepath: str) -> None:
+        """Set filepath to input data of the active profile (the profile is named by hash of the file)."""
+
+        if self._profile is not None and self._profile.active:
+            self._profile.filepath = filepath
+
+    def pause_event_loop(self) -> AbstractContextManager[None]:
+        """Pause profiling while Qt event loop is running (unless the event loop is profiled)."""
+
+        if self.event_loop or self._profile is None or not self._profile.active:
+            return nullcontext()
+        return self._pause()
+
+    @contextmanager
+    def _pause(self) -> Iterator[None]:
+        collector = self._profile.collector
+
+        collector.stop()
+        try:
+            yield
+        finally:
+            collector.start()
+
+
+def hash_file(filepath: str, n: int = 12) -> str:
+    """Get (first `n` hex digits of) SHA-1 hash of content of file."""
+
+    try:
+        with open(filepath, 'rb') as file:
+            return hashlib.file_digest(file, 'sha1').hexdigest()[:n]
+    except OSError:
+        return 'unknown'
+
+
+PROFILER = Profiler(
+    mode=PLUGIN_CONFIG.profile,
+    event_loop=PLUGIN_CONFIG.profile_event_loop,
+    interval=PLUGIN_CONFIG.profile_interval,
+)
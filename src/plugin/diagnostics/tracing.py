@@ -0,0 +1,130 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import Any, Self
+
+from plugin.config import PLUGIN_CONFIG
+
+
+LOGGER = logging.getLogger('plugin-absorption-correction')
+
+
+class Span:
+    """Timed span of tracer (to use as context manager)."""
+
+    def __init__(self, tracer: 'Tracer', name: str, attributes: dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+
+        self.thread_id = None
+        self.started_at = None
+        self.duration = None
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> Self:
+        self.thread_id = threading.get_ident()
+        self.started_at = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.duration = time.perf_counter_ns() - self.started_at
+        if exc_value is not None:
+            self.attributes['error'] = repr(exc_value)
+
+        self.tracer.spans.append(self)
+
+
+class NullSpan:
+    """Span of disabled tracer."""
+
+    def set_attributes(self, **attributes: Any) -> None:
+        return None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer:
+    """Collect nested spans (by threads) and export them as Chrome trace events."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter_ns()
+
+    def span(self, name: str, **attributes: Any) -> Span | NullSpan:
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name=name, attributes=attributes)
+
+    def reset(self) -> None:
+        """Drop collected spans (to collect spans of the next run)."""
+
+        self.spans = []
+
+    def durations(self) -> Mapping[str, float]:
+        """Total durations of spans by name, in seconds."""
+
+        durations = defaultdict(float)
+        for span in self.spans:
+            durations[span.name] += span.duration / 1e9
+        return dict(durations)
+
+    def events(self) -> list[Mapping[str, Any]]:
+        pid = os.getpid()
+
+        return [
+            {
+                'name': span.name,
+                'cat': 'plugin',
+                'ph': 'X',
+                'ts': (span.started_at - self._origin) / 1e3,
+                'dur': span.duration / 1e3,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': {key: format_attribute(value) for key, value in span.attributes.items()},
+            }
+            for span in list(self.spans)
+        ]
+
+    def export(self, filepath: str) -> None:
+        """Export spans to `filepath` in Chrome trace event format (open in `chrome://tracing` or Perfetto)."""
+
+        if not self.enabled or not self.spans:
+            return None
+
+        try:
+            with open(filepath, 'w', encoding='utf-8') as file:
+                json.dump({'traceEvents': self.events(), 'displayTimeUnit': 'ms'}, file)
+        except OSError as error:
+            LOGGER.warning('Export trace failed: %r', error)
+        else:
+            LOGGER.debug('Trace is exported to: %r', filepath)
+
+
+def format_attribute(value: Any) -> int | float | bool | str:
+    if isinstance(value, (int, float, bool)):
+        return value
+    return str(value)
+
+
+TRACER = Tracer(
+    enabled=PLUGIN_CONFIG.trace or PLUGIN_CONFIG.metrics_journal,
+)
+if PLUGIN_CONFIG.trace:
+    atexit.register(TRACER.export, PLUGIN_CONFIG.trace_filepath)
@@ -1,6 +1,8 @@
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
+import pandas as pd
+
 from plugin.dto.filepath import AtomFilepath
 from plugin.dto.meta import AtomMeta
 from spectrumlab.types import Frame, R
@@ -14,6 +16,8 @@ class AtomDatum:
     frame: Frame
     bounds: tuple[R, R] | None = None
     polynom: Sequence[tuple[R, R]] | None = None
+    value_linearized: pd.Series | None = None
+    filepath: AtomFilepath | None = None  # to parse bad points of transients on demand
 
 
 @dataclass
@@ -1,9 +1,104 @@
+import atexit
+import gzip
 import logging
 import logging.config
+import logging.handlers
+import os
+import queue
+import shutil
+import time
 
 from plugin.config import PLUGIN_CONFIG
 
 
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler counting records dropped on full queue (instead of blocking the calling thread).
+
+    Records emitted after the listener is stopped (by `atexit` hooks registered earlier) are written in place.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.n_dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        listener = getattr(self, 'listener', None)
+        if (listener is not None) and (listener._thread is None):
+            listener.handle(record)
+            return None
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.n_dropped += 1
+
+
+class BlockingQueueListener(logging.handlers.QueueListener):
+    """Queue listener waiting for a free slot to enqueue sentinel (so it is stopped on full queue too)."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler compressing rotated files with gzip and removing ones older than `max_age` days."""
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int,
+        backup_count: int,
+        max_age: float = 0,
+        encoding: str | None = None,
+    ) -> None:
+        super().__init__(
+            filename,
+            mode='a',
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding=encoding,
+            delay=True,
+        )
+
+        self.max_age = max_age
+        self.namer = compressed_name
+        self.rotator = compress
+
+        self.remove_expired()
+
+    def doRollover(self) -> None:  # noqa: N802
+        super().doRollover()
+
+        self.remove_expired()
+
+    def remove_expired(self) -> None:
+        """Remove rotated files older than `max_age` days."""
+
+        if self.max_age <= 0:
+            return None
+
+        expired_at = time.time() - 24 * 60 * 60 * self.max_age
+        for i in range(1, self.backupCount + 1):
+            filename = self.rotation_filename('{}.{}'.format(self.baseFilename, i))
+
+            try:
+                if os.path.getmtime(filename) < expired_at:
+                    os.remove(filename)
+            except OSError:
+                continue
+
+
+def compressed_name(name: str) -> str:
+    return name + '.gz'
+
+
+def compress(source: str, dest: str) -> None:
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
 def setdefault_logger():
     config = dict(
         version=1,
@@ -23,24 +118,36 @@ def setdefault_logger():
                 'formatter': 'formatter',
             },
             file_handler={
-                'class': 'logging.FileHandler',
+                'class': CompressedRotatingFileHandler,
                 'level': PLUGIN_CONFIG.logging_level.value,
                 'filename': '.log',
-                'mode': 'a',
+                'max_bytes': PLUGIN_CONFIG.logging_max_bytes,
+                'backup_count': PLUGIN_CONFIG.logging_backup_count,
+                'max_age': PLUGIN_CONFIG.logging_max_age,
                 'formatter': 'formatter',
                 'encoding': 'utf-8',
             },
+            queue_handler={
+                'class': DroppingQueueHandler,
+                'handlers': ['file_handler', 'stream_handler'],
+                'queue': {
+                    '()': queue.Queue,
+                    'maxsize': PLUGIN_CONFIG.logging_queue_size,
+                },
+                'listener': BlockingQueueListener,
+                'respect_handler_level': True,
+            },
         ),
 
         loggers={
             'plugin-absorption-correction': {
                 'level': PLUGIN_CONFIG.logging_level.value,
-                'handlers': ['file_handler', 'stream_handler'],
+                'handlers': ['queue_handler'],
                 'propagate': False,
             },
             'spectrumlab': {
                 'level': PLUGIN_CONFIG.logging_level.value,
-                'handlers': ['file_handler', 'stream_handler'],
+                'handlers': ['queue_handler'],
                 'propagate': False,
             },
         },
@@ -48,5 +155,30 @@ def setdefault_logger():
 
     logging.config.dictConfig(config)
 
+    # write records in background thread
+    logging.getHandlerByName('queue_handler').listener.start()
+    atexit.register(stop_queue_listener)
+
+
+def stop_queue_listener() -> None:
+    """Write all queued records and stop background thread. Number of dropped records is written at last."""
+
+    handler = logging.getHandlerByName('queue_handler')
+    if (handler is None) or (handler.listener is None) or (handler.listener._thread is None):
+        return None
+
+    handler.listener.stop()
+
+    if handler.n_dropped > 0:
+        record = logging.makeLogRecord(dict(
+            name='plugin-absorption-correction',
+            levelno=logging.WARNING,
+            levelname=logging.getLevelName(logging.WARNING),
+            msg='%d log records are dropped (logging queue is full)',
+            args=(handler.n_dropped,),
+        ))
+        for target in handler.listener.handlers:
+            target.handle(record)
+
 
 setdefault_logger()
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from spectrumlab.peaks.analyte_peaks.intensity.transformers import (
@@ -6,24 +7,69 @@ from spectrumlab.peaks.analyte_peaks.intensity.transformers import (
 from spectrumlab.types import Frame
 
 
+DEFAULT_CHUNK_SIZE = 2**22
+
+
 def process_data(
     __data: Frame,
     transformer: RegressionIntensityTransformer,
 ) -> Frame:
+    frame = __data.drop(index='blank', errors='ignore')
 
     data = pd.DataFrame(
-        [
-            {
-                'probe': i,
-                'parallel': j,
-                'concentration': __data.loc[(i, j), 'concentration'],
-                'intensity': __data.loc[(i, j), 'intensity'],
-                'intensity_true': transformer.estimate_intensity(__data.loc[(i, j), 'concentration']),
-                'intensity_linearized': transformer(__data.loc[(i, j), 'intensity']),
-            }
-            for i, j in __data.drop(index='blank', errors='ignore').index
-        ],
-        columns=['probe', 'parallel', 'concentration', 'intensity', 'intensity_true', 'intensity_linearized'],
-    ).set_index(['probe', 'parallel'])
+        {
+            'concentration': frame['concentration'].to_numpy(),
+            'intensity': frame['intensity'].to_numpy(),
+            'intensity_true': [
+                transformer.estimate_intensity(concentration)
+                for concentration in frame['concentration']
+            ],
+            'intensity_linearized': transformer.apply(frame['intensity'].to_numpy()),
+        },
+        index=frame.index.rename(['probe', 'parallel']),
+        columns=['concentration', 'intensity', 'intensity_true', 'intensity_linearized'],
+    )
 
     return data.sort_values(by='concentration')
+
+
+def aggregate_data(
+    __data: Frame,
+) -> Frame:
+    """Average `concentration` and `intensity` of parallels for each probe."""
+
+    frame = __data[['concentration', 'intensity']]
+    frame = frame.dropna(subset=['concentration'])
+    frame = frame.groupby(level=0, sort=False).mean()
+
+    return frame
+
+
+def linearize_transients(
+    __data: Frame,
+    transformer: RegressionIntensityTransformer,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> pd.Series:
+    """Linearize `value` transients of all parallels by chunks of at most `chunk_size` samples.
+
+    Transients are written to one `float64` buffer, so memory over the result is bounded by `chunk_size`.
+    """
+    chunk_size = max(chunk_size, 1)
+
+    values = __data['value'].to_numpy()
+    sizes = np.fromiter(map(len, values), dtype=int, count=len(values))
+    offsets = np.cumsum(sizes)
+
+    buffer = np.empty(offsets[-1] if len(offsets) else 0, dtype=float)
+    if len(values) > 0:
+        np.concatenate(values, out=buffer, casting='same_kind')
+
+    for i in range(0, len(buffer), chunk_size):  # chunks span rows
+        buffer[i:i + chunk_size] = transformer.apply(buffer[i:i + chunk_size])
+
+    return pd.Series(
+        np.split(buffer, offsets[:-1]) if len(values) > 0 else [],
+        index=__data.index,
+        dtype=object,
+        name='value_linearized',
+    )
@@ -2,9 +2,21 @@ import logging
 import time
 from collections.abc import Mapping
 
+import numpy as np
+
 from plugin.config import PluginConfig
+from plugin.diagnostics import LATENCY, MEMORY, TRACER
 from plugin.dto import AtomDatum
-from plugin.managers.correction_manager.core import process_data
+from plugin.managers.correction_manager.core import (
+    aggregate_data,
+    linearize_transients,
+    process_data,
+)
+from plugin.managers.correction_manager.exceptions import LookupTableError
+from plugin.managers.correction_manager.lookup_table import (
+    LookupTableTransformer,
+    compile_transformer,
+)
 from plugin.presentation import retrieve_transformer
 from spectrumlab.peaks.analyte_peaks.intensity.transformers import (
     RegressionIntensityTransformer,
@@ -27,6 +39,8 @@ class CorrectionManager:
         self.plugin_config = plugin_config
 
         self.transformer = {}
+        self.aggregated = {}
+        self.n_cache_hits = 0
 
     def retrieve(
         self,
@@ -38,42 +52,96 @@ class CorrectionManager:
             'Start to restoring transformer...',
         )
         try:
-            retrieve_transformer(
-                data=data,
-                callback=self.update,
-            )
+            with TRACER.span('retrieve', n_columns=len(data)):
+                retrieve_transformer(
+                    data=data,
+                    callback=self.update,
+                )
         except Exception as error:
             LOGGER.error(
-                'Time elapsed for restoring: {elapsed:.4f}, s'.format(
-                    elapsed=time.perf_counter() - started_at,
-                ),
+                'Time elapsed for restoring: %.4f, s',
+                time.perf_counter() - started_at,
             )
         else:
             return self.transformer
         finally:
-            if LOGGER.isEnabledFor(logging.INFO):
-                LOGGER.info(
-                    'Time elapsed for restoring: {elapsed:.4f}, s'.format(
-                        elapsed=time.perf_counter() - started_at,
-                    ),
+            LOGGER.info(
+                'Time elapsed for restoring: %.4f, s',
+                time.perf_counter() - started_at,
+            )
+
+    def linearize(
+        self,
+        data: Mapping[str, AtomDatum],
+    ) -> None:
+        started_at = time.perf_counter()
+
+        for column_id, datum in data.items():
+            if column_id not in self.transformer:
+                continue
+
+            with TRACER.span('linearize', column_id=column_id, n_rows=len(datum.frame)):
+                datum.value_linearized = linearize_transients(
+                    datum.frame,
+                    transformer=self.transformer[column_id],
+                    chunk_size=self.plugin_config.linearize_chunk_size,
                 )
 
+        LOGGER.info(
+            'Time elapsed for linearization: %.4f, s',
+            time.perf_counter() - started_at,
+        )
+
     def update(
         self,
         column_id: str,
         frame: Frame,
         bounds: tuple[R, R] | None,
     ) -> tuple[tuple[R, R], Frame]:
-        data = process_frame(frame)
-        bounds = bounds or estimate_bounds(data)
+        with MEMORY.measure('update', column_id=column_id, n_rows=len(frame)):
+            data = process_frame(frame)
+            bounds = bounds or estimate_bounds(data)
 
-        self.transformer[column_id] = RegressionIntensityTransformer.create(
-            data=data,
-            bounds=bounds,
-        )
+            if column_id in self.aggregated:
+                self.n_cache_hits += 1
+            else:
+                self.aggregated[column_id] = aggregate_data(frame)
 
-        processed_data = process_data(
-            frame,
-            transformer=self.transformer[column_id],
-        )
-        return bounds, processed_data
+            with LATENCY.measure('fit'), TRACER.span('fit', column_id=column_id, n_rows=len(frame)):
+                transformer = RegressionIntensityTransformer.create(
+                    data=data,
+                    bounds=bounds,
+                )
+                if self.plugin_config.lookup_table:
+                    transformer = self._compile(
+                        transformer=transformer,
+                        frame=frame,
+                    )
+            self.transformer[column_id] = transformer
+
+            with LATENCY.measure('process'):
+                processed_data = process_data(
+                    frame,
+                    transformer=self.transformer[column_id],
+                )
+            return bounds, processed_data
+
+    def _compile(
+        self,
+        transformer: RegressionIntensityTransformer,
+        frame: Frame,
+    ) -> RegressionIntensityTransformer | LookupTableTransformer:
+
+        # domain starts at the smallest positive intensity (models can be fitted in log space)
+        intensity = frame['intensity'].to_numpy(dtype=float)
+        intensity = intensity[intensity > 0]
+
+        try:
+            return compile_transformer(
+                transformer,
+                domain=(np.min(intensity), np.max(intensity)) if intensity.size else (np.nan, np.nan),
+                tolerance=self.plugin_config.lookup_table_tolerance,
+            )
+        except LookupTableError as error:
+            LOGGER.warning('Compile lookup table failed: %r', error)
+            return transformer
@@ -3,3 +3,7 @@ from plugin.exceptions import PluginError
 
 class CorrectionManagerError(PluginError):
     pass
+
+
+class LookupTableError(CorrectionManagerError):
+    pass
@@ -0,0 +1,140 @@
+import numpy as np
+
+from plugin.core.approximation import estimate_error
+from plugin.managers.correction_manager.exceptions import LookupTableError
+from spectrumlab.peaks.analyte_peaks.intensity.transformers import (
+    RegressionIntensityTransformer,
+)
+from spectrumlab.types import Array, R
+
+
+DEFAULT_N_POINTS = 64
+DEFAULT_MAX_POINTS = 2**16
+
+
+class LookupTableTransformer:
+    """Monotone lookup table compiled from a fitted `RegressionIntensityTransformer`."""
+
+    def __init__(
+        self,
+        transformer: RegressionIntensityTransformer,
+        xp: Array[float],
+        fp: Array[float],
+        tolerance: float,
+        error: float,
+    ) -> None:
+
+        self.transformer = transformer
+        self.xp = xp
+        self.fp = fp
+        self.tolerance = tolerance
+        self.error = error
+
+    @property
+    def bounds(self) -> tuple[R, R]:
+        return self.transformer.bounds
+
+    @property
+    def domain(self) -> tuple[R, R]:
+        return self.xp[0].item(), self.xp[-1].item()
+
+    def estimate_intensity(self, *args, **kwargs):
+        return self.transformer.estimate_intensity(*args, **kwargs)
+
+    def apply(self, values: Array[float]) -> Array[float]:
+        values = np.asarray(values, dtype=float)
+
+        x = values.ravel()
+        y = np.interp(x, self.xp, self.fp)
+
+        # values out of domain are processed by exact model
+        mask = (x < self.xp[0]) | (x > self.xp[-1])
+        if np.any(mask):
+            y[mask] = self.transformer.apply(x[mask])
+
+        return y.reshape(values.shape)
+
+    def __call__(self, value: R) -> R:
+        return self.apply(value).item()
+
+    def __len__(self) -> int:
+        return len(self.xp)
+
+    def __repr__(self) -> str:
+        cls = self.__class__
+        return '{name}(n_points={n_points}, tolerance={tolerance}, error={error:.2e})'.format(
+            name=cls.__name__,
+            n_points=len(self),
+            tolerance=self.tolerance,
+            error=self.error,
+        )
+
+
+def compile_transformer(
+    transformer: RegressionIntensityTransformer,
+    domain: tuple[R, R],
+    tolerance: float,
+    n_points: int = DEFAULT_N_POINTS,
+    max_points: int = DEFAULT_MAX_POINTS,
+) -> LookupTableTransformer:
+    """Compile `transformer` into a lookup table within given relative `tolerance` on `domain`."""
+
+    lb, ub = domain
+    if not (np.isfinite(lb) and np.isfinite(ub) and lb < ub):
+        raise LookupTableError('Domain {!r} is not valid!'.format(domain))
+
+    xp = np.linspace(lb, ub, n_points)
+    fp = evaluate(transformer, xp)
+    check_monotone(fp)
+
+    # refine intervals till tolerance is reached at the middle points
+    while True:
+        x = (xp[:-1] + xp[1:]) / 2
+        y = evaluate(transformer, x)
+
+        error = estimate_error((fp[:-1] + fp[1:]) / 2, y, fp=fp)
+        refined = error > tolerance
+        if not np.any(refined):
+            break
+
+        if len(xp) + np.count_nonzero(refined) > max_points:
+            raise LookupTableError('Tolerance {} is not reached with {} points!'.format(tolerance, max_points))
+
+        index = np.flatnonzero(refined) + 1
+        xp = np.insert(xp, index, x[refined])
+        fp = np.insert(fp, index, y[refined])
+        check_monotone(fp)
+
+    # verify against exact model
+    x = np.concatenate([
+        xp[:-1] + (xp[1:] - xp[:-1]) * ratio
+        for ratio in (.25, .75)
+    ])
+    y = evaluate(transformer, x)
+
+    error = np.max(estimate_error(np.interp(x, xp, fp), y, fp=fp))
+    if error > tolerance:
+        raise LookupTableError('Tolerance {} is not verified: {:.2e}!'.format(tolerance, error))
+
+    return LookupTableTransformer(
+        transformer=transformer,
+        xp=xp,
+        fp=fp,
+        tolerance=tolerance,
+        error=error.item(),
+    )
+
+
+def evaluate(transformer: RegressionIntensityTransformer, x: Array[float]) -> Array[float]:
+
+    y = np.asarray(transformer.apply(x), dtype=float)
+    if not np.all(np.isfinite(y)):
+        raise LookupTableError('Transformer is not finite on domain!')
+
+    return y
+
+
+def check_monotone(fp: Array[float]) -> None:
+
+    if not np.all(np.diff(fp) > 0):
+        raise LookupTableError('Transformer is not monotone on domain!')
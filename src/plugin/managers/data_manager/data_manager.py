@@ -2,6 +2,7 @@ import logging
 import time
 from pathlib import Path
 
+from plugin.diagnostics import MEMORY, TRACER
 from plugin.dto import AtomData
 from plugin.managers.data_manager.exceptions import (
     DataManagerError,
@@ -27,31 +28,29 @@ class DataManager:
 
         started_at = time.perf_counter()
         try:
-            filepath = FilepathParser.parse(xml)
+            with TRACER.span('parse filepath'):
+                filepath = FilepathParser.parse(xml)
         except ParseFilepathXMLError as error:
             LOGGER.error('%r', error)
             raise
         else:
             LOGGER.info('Filepath to data: %r', filepath)
         finally:
-            if LOGGER.isEnabledFor(logging.INFO):
-                LOGGER.info(
-                    'Time elapsed for filepath parsing: {elapsed:.4f}, s'.format(
-                        elapsed=time.perf_counter() - started_at,
-                    ),
-                )
+            LOGGER.info(
+                'Time elapsed for filepath parsing: %.4f, s',
+                time.perf_counter() - started_at,
+            )
 
         started_at = time.perf_counter()
         try:
-            atom_data = AtomDataParser.parse(filepath)
+            with TRACER.span('parse data', filepath=filepath), MEMORY.measure('parse', filepath=filepath):
+                atom_data = AtomDataParser.parse(filepath)
         except (LoadDataXMLError, ParseDataXMLError) as error:
             raise DataManagerError from error
         else:
             return atom_data
         finally:
-            if LOGGER.isEnabledFor(logging.INFO):
-                LOGGER.info(
-                    'Time elapsed for data parsing: {elapsed:.4f}, s'.format(
-                        elapsed=time.perf_counter() - started_at,
-                    ),
-                )
+            LOGGER.info(
+                'Time elapsed for data parsing: %.4f, s',
+                time.perf_counter() - started_at,
+            )
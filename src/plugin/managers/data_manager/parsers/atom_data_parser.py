@@ -1,6 +1,8 @@
 import logging
+import os
 import xml.etree.ElementTree as ElementTree
 
+from plugin.diagnostics import TRACER
 from plugin.dto import AtomData, AtomFilepath
 from plugin.managers.data_manager.exceptions import (
     LoadDataXMLError,
@@ -11,6 +13,7 @@ from plugin.managers.data_manager.exceptions import (
 from plugin.managers.data_manager.parsers.atom_meta_parser import AtomMetaParser
 from plugin.managers.data_manager.parsers.atom_table_parser import AtomTableParser
 from plugin.types import XML
+from spectrumlab.types import Frame
 
 LOGGER = logging.getLogger('plugin-absorption-correction')
 
@@ -40,7 +43,9 @@ def load_xml(__filepath: AtomFilepath) -> XML | None:
     """Load `xml` element object from file for a given `filepath`."""
 
     try:
-        tree = ElementTree.parse(__filepath)
+        with TRACER.span('load xml') as span:
+            tree = ElementTree.parse(__filepath)
+            span.set_attributes(n_bytes=os.path.getsize(__filepath))
     except FileNotFoundError as error:
         LOGGER.error('Parse `xml` failed: %r', error)
         raise LoadDataXMLError('File not found: {!r}!'.format(__filepath)) from error
@@ -52,13 +57,15 @@ def load_xml(__filepath: AtomFilepath) -> XML | None:
 def parse_xml(__filepath: AtomFilepath, xml: XML) -> 'AtomData':
 
     try:
-        meta = AtomMetaParser.parse(xml=xml)
+        with TRACER.span('parse meta'):
+            meta = AtomMetaParser.parse(xml=xml)
     except Exception as error:
         LOGGER.error('Parse `meta` failed: %r', error)
         raise ParseMetaXMLError from error
 
     try:
-        data = AtomTableParser.from_xml(xml)
+        with TRACER.span('parse table'):
+            data = AtomTableParser.from_xml(xml, filepath=__filepath)
     except ParseTableXMLError as error:
         LOGGER.error('Parse `data` failed: %r', error)
         raise ParseTableXMLError from error
@@ -71,3 +78,16 @@ def parse_xml(__filepath: AtomFilepath, xml: XML) -> 'AtomData':
         meta=meta,
         data=data,
     )
+
+
+def parse_bad(__filepath: AtomFilepath, column_id: str) -> Frame:
+    """Parse bad points of column's transients from file for a given `filepath`."""
+
+    xml = load_xml(__filepath)
+
+    try:
+        with TRACER.span('parse bad', column_id=column_id):
+            return AtomTableParser.parse_bad(xml, column_id)
+    except Exception as error:
+        LOGGER.error('Parse bad points of column %r failed: %r', column_id, error)
+        raise ParseTableXMLError from error
@@ -1,16 +1,17 @@
 import logging
 from base64 import b64decode
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 
 import numpy as np
 import pandas as pd
 
 from plugin.config import PLUGIN_CONFIG
-from plugin.dto import AtomDatum
+from plugin.diagnostics import TRACER
+from plugin.dto import AtomDatum, AtomFilepath
 from plugin.managers.data_manager.exceptions import ParseTableXMLError
 from plugin.types import XML
-from spectrumlab.types import Array
+from spectrumlab.types import Array, Frame
 
 LOGGER = logging.getLogger('plugin-absorption-correction')
 
@@ -18,7 +19,7 @@ LOGGER = logging.getLogger('plugin-absorption-correction')
 class AtomTableParser:
 
     @classmethod
-    def from_xml(cls, __xml: XML) -> Mapping[str, AtomDatum]:
+    def from_xml(cls, __xml: XML, filepath: AtomFilepath | None = None) -> Mapping[str, AtomDatum]:
 
         # lines
         line = []
@@ -52,77 +53,45 @@ class AtomTableParser:
 
         # datum
         datum = defaultdict(list)
-        for __probe in __xml.find('probes').findall('probe'):
-            if __probe.attrib.get('visible', 'no') == 'no':
-                continue
-
-            probe_id = __probe.attrib['id']
-            probe_name = __probe.attrib['name']
-
-            for __spe in __probe.findall('spe'):
-                if __spe.attrib.get('disabled', 'no') == 'yes':
-                    continue
-
-                parallel_name = __spe.attrib['name']
-
-                for __graph in __spe.findall('graphs/graph'):
-                    column_id = __graph.attrib['id']
-
-                    if column_id in line.index:
-
-                        try:
-                            value = parse_intensity(__graph)
-                            if __graph.find('bad'):
-                                mask = parse_mask(__graph)
-                                value = np.where(~mask, value, np.nan)
-                        except Exception as error:
-                            LOGGER.error(
-                                'Parse column %d failed', column_id,
-                            )
-                            raise ParseTableXMLError from error
-
-                        datum[column_id].append(dict(
-                            probe_name=probe_name,
-                            parallel_name=parallel_name,
-                            concentration=concentrations[column_id].loc[probe_id, 'value'],
-                            intensity=np.nanmax(value),
-                            value=value,
-                        ))
-
-        # bounds
-        bounds = {}
-
-        __plugin = __xml.find('plugin-absorption-correction')
-        if __plugin:
-            for __column in __plugin.findall('column'):
-                column_id = __column.attrib['id']
-
-                __bounds = __column.find('bounds')
-                bounds[column_id] = (float(__bounds.attrib['lb']), float(__bounds.attrib['ub']))
+        for probe_id, probe_name, parallel_name, __graph in iterate_graphs(__xml):
+            column_id = __graph.attrib['id']
 
-        # polynom
-        polynom = defaultdict(list)
-
-        __plugin = __xml.find('plugin-absorption-correction')
-        if __plugin:
-            for __column in __plugin.findall('column'):
-                column_id = __column.attrib['id']
+            if column_id in line.index:
 
-                __polynom = __column.find('polynom')
-                for __point in __polynom.findall('point'):
-                    polynom[column_id].append((float(__point.attrib['x']), float(__point.attrib['y'])))
+                try:
+                    value = parse_intensity(__graph)
+                    if __graph.find('bad') is not None:  # element without children is falsy
+                        mask = parse_mask(__graph)
+                        value = np.where(~mask, value, np.nan)
+                except Exception as error:
+                    LOGGER.error(
+                        'Parse column %d failed', column_id,
+                    )
+                    raise ParseTableXMLError from error
+
+                datum[column_id].append(dict(
+                    probe_name=probe_name,
+                    parallel_name=parallel_name,
+                    concentration=concentrations[column_id].loc[probe_id, 'value'],
+                    intensity=np.nanmax(value),
+                    value=value,
+                ))
+
+        # bounds and polynom
+        bounds, polynom = parse_plugin(__xml.find('plugin-absorption-correction'))
 
         # data
         data = {}
         for column_id in datum.keys():
             nickname = line.loc[column_id, 'nickname']
 
-            frame = pd.DataFrame(datum[column_id]).set_index(['probe_name', 'parallel_name'])
-            if PLUGIN_CONFIG.black_name in frame.index:
-                blank = frame.loc[PLUGIN_CONFIG.black_name, 'intensity'].mean().item()
+            with TRACER.span('parse table column', column_id=column_id, n_rows=len(datum[column_id])):
+                frame = pd.DataFrame(datum[column_id]).set_index(['probe_name', 'parallel_name'])
+                if PLUGIN_CONFIG.black_name in frame.index:
+                    blank = frame.loc[PLUGIN_CONFIG.black_name, 'intensity'].mean().item()
 
-                frame['intensity'] -= blank
-                frame['value'] -= blank
+                    frame['intensity'] -= blank
+                    frame['value'] -= blank
 
             data[column_id] = AtomDatum(
                 column_id=column_id,
@@ -130,9 +99,64 @@ class AtomTableParser:
                 frame=frame,
                 bounds=bounds.get(column_id),
                 polynom=polynom.get(column_id),
+                filepath=filepath,
             )
         return data
 
+    @classmethod
+    def parse_bad(cls, __xml: XML, column_id: str) -> Frame:
+        """Parse indices and values of bad points of column's transients (rows are in order of `from_xml` frame).
+
+        Bad points are needed by the transient view only, so they are parsed on its demand.
+        """
+
+        datum = []
+        for _, probe_name, parallel_name, __graph in iterate_graphs(__xml):
+            if __graph.attrib['id'] != column_id:
+                continue
+
+            value = parse_intensity(__graph)
+            mask = np.full(len(value), False)
+            if __graph.find('bad') is not None:  # element without children is falsy
+                mask = parse_mask(__graph)
+
+            datum.append(dict(
+                probe_name=probe_name,
+                parallel_name=parallel_name,
+                intensity=np.nanmax(np.where(~mask, value, np.nan)),
+                bad=np.flatnonzero(mask),
+                value_bad=value[mask],
+            ))
+
+        frame = pd.DataFrame(datum, columns=['probe_name', 'parallel_name', 'intensity', 'bad', 'value_bad'])
+        frame = frame.set_index(['probe_name', 'parallel_name'])
+        if PLUGIN_CONFIG.black_name in frame.index:
+            blank = frame.loc[PLUGIN_CONFIG.black_name, 'intensity'].mean().item()
+
+            frame['value_bad'] -= blank
+
+        return frame[['bad', 'value_bad']]
+
+
+def iterate_graphs(__xml: XML) -> Iterator[tuple[str, str, str, XML]]:
+    """Iterate over graphs of visible probes and enabled parallels (with probe's id and name and parallel's name)."""
+
+    for __probe in __xml.find('probes').findall('probe'):
+        if __probe.attrib.get('visible', 'no') == 'no':
+            continue
+
+        probe_id = __probe.attrib['id']
+        probe_name = __probe.attrib['name']
+
+        for __spe in __probe.findall('spe'):
+            if __spe.attrib.get('disabled', 'no') == 'yes':
+                continue
+
+            parallel_name = __spe.attrib['name']
+
+            for __graph in __spe.findall('graphs/graph'):
+                yield probe_id, probe_name, parallel_name, __graph
+
 
 def numpy_array_from_b64(buffer: str, dtype: type) -> Array[float]:
     return np.frombuffer(b64decode(buffer.strip()), dtype=dtype)
@@ -158,3 +182,42 @@ def parse_mask(__graph: XML) -> Array[bool]:
     except Exception:
         LOGGER.error("Parse `intensity` failed. Check xpath: %r", xpath)
         raise
+
+
+def parse_plugin(
+    __plugin: XML | None,
+) -> tuple[Mapping[str, tuple[float, float]], Mapping[str, list[tuple[float, float]]]]:
+    """Parse bounds and polynom of columns from plugin's section (columns without them are skipped)."""
+
+    bounds, polynom = {}, {}
+    if __plugin is None:
+        return bounds, polynom
+
+    for __column in __plugin.findall('column'):
+        column_id = __column.attrib['id']
+
+        __bounds = __column.find('bounds')
+        __polynom = __column.find('polynom')
+        if (__bounds is None) or (__polynom is None):  # `unchanged="yes"` column of incremental report
+            LOGGER.warning('Column %r without bounds or polynom is skipped (it will be recalculated)', column_id)
+            continue
+
+        bounds[column_id] = (float(__bounds.attrib['lb']), float(__bounds.attrib['ub']))
+
+        if __polynom.attrib.get('encoding') == 'base64':
+            polynom[column_id] = parse_compact_polynom(__polynom)
+        else:
+            polynom[column_id] = [
+                (float(__point.attrib['x']), float(__point.attrib['y']))
+                for __point in __polynom.findall('point')
+            ]
+
+    return bounds, polynom
+
+
+def parse_compact_polynom(__polynom: XML) -> list[tuple[float, float]]:
+    dtype = np.dtype(__polynom.attrib.get('dtype', 'float64')).newbyteorder('<')
+
+    x = numpy_array_from_b64(__polynom.find('xvals').text or '', dtype=dtype)
+    y = numpy_array_from_b64(__polynom.find('yvals').text or '', dtype=dtype)
+    return list(zip(x.tolist(), y.tolist()))
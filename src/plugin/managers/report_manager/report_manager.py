@@ -1,21 +1,28 @@
-import xml.etree.ElementTree as ElementTree
-from base64 import b64encode
-from collections.abc import Mapping, Sequence
-from xml.dom import minidom
+import logging
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
 
 from plugin.config import PluginConfig
+from plugin.diagnostics import MEMORY, TRACER
 from plugin.dto import AtomDatum
+from plugin.managers.correction_manager.core import aggregate_data
+from plugin.managers.report_manager.simplification import simplify_polynom
+from plugin.managers.report_manager.storage import archive, write_atomic
+from plugin.managers.report_manager.writer import write_messages, write_report
 from spectrumlab.peaks.analyte_peaks.intensity.transformers import (
     RegressionIntensityTransformer,
 )
-from spectrumlab.types import Array
-
+from spectrumlab.types import Array, Frame, R
 
-REPORT_PREFIX = '<?xml version="1.0" encoding="uft-8"?>'
 
+LOGGER = logging.getLogger('plugin-absorption-correction')
 
-def b64_from_numpy_array(array: Array) -> str:
-    return b64encode(array.tobytes()).decode('ascii')
+REPORT_PREFIX = '<?xml version="1.0" encoding="uft-8"?>'
+RTOL = 1e-6
 
 
 class ReportManager:
@@ -27,36 +34,79 @@ class ReportManager:
 
         self.plugin_config = plugin_config
 
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='report-manager',
+        )
+        self._futures = []
+
     def build(
         self,
         data: Mapping[str, AtomDatum],
         transformers: Mapping[str, RegressionIntensityTransformer],
+        aggregated: Mapping[str, Frame] | None = None,
         dump: bool = False,
     ) -> str:
+        aggregated = aggregated or {}
+
+        with TRACER.span('build report', n_columns=len(data)) as span, MEMORY.measure('build', n_columns=len(data)):
+            results = self._build_columns(
+                data=data,
+                transformers=transformers,
+                aggregated=aggregated,
+            )
+            report = wrap(
+                results,
+                compact=self.plugin_config.compact_report,
+            )
+            span.set_attributes(n_bytes=len(report))
+
+        if dump:
+            self.dump(
+                report=report,
+            )
+
+        return report
+
+    def _build_columns(
+        self,
+        data: Mapping[str, AtomDatum],
+        transformers: Mapping[str, RegressionIntensityTransformer],
+        aggregated: Mapping[str, Frame],
+    ) -> list[Mapping]:
 
         results = []
         for column_id, datum in data.items():
+            transformer = transformers[column_id]
+
+            polynom = self._build_polynom(
+                datum=datum,
+                transformer=transformer,
+                aggregated=aggregated.get(column_id),
+            )
+            is_unchanged = self.plugin_config.incremental_report and not is_changed(
+                datum,
+                bounds=transformer.bounds,
+                polynom=polynom,
+            )
+            if is_unchanged:
+                results.append(dict(
+                    id=column_id,
+                    nickname=datum.nickname,
+                    unchanged=True,
+                ))
+                continue
 
             results.append(dict(
                 id=column_id,
                 nickname=datum.nickname,
                 bounds=self._build_bounds(
-                    transformer=transformers[column_id],
-                ),
-                polynom=self._build_polynom(
-                    datum=datum,
-                    transformer=transformers[column_id],
+                    transformer=transformer,
                 ),
+                polynom=polynom,
             ))
 
-        report = wrap(results)
-
-        if dump:
-            self.dump(
-                report=report,
-            )
-
-        return report
+        return results
 
     def _build_bounds(
         self,
@@ -74,62 +124,111 @@ class ReportManager:
         self,
         datum: AtomDatum,
         transformer: RegressionIntensityTransformer,
-    ) -> Sequence[Mapping[str, str]]:
+        aggregated: Frame | None = None,
+    ) -> tuple[Array[float], Array[float]]:
 
-        frame = datum.frame.copy()
-        frame = frame.dropna(subset=['concentration'])
-        frame = frame.groupby(level=0, sort=False).mean()
-        frame['intensity_hat'] = transformer.apply(frame['intensity'])
+        if aggregated is None:
+            aggregated = aggregate_data(datum.frame)
+
+        x = aggregated['intensity'].to_numpy(dtype=float)
+        y = np.asarray(transformer.apply(aggregated['intensity']), dtype=float)
+
+        if self.plugin_config.polynom_tolerance > 0:
+            x, y = simplify_polynom(
+                x, y,
+                transformer=transformer,
+                tolerance=self.plugin_config.polynom_tolerance,
+            )
 
-        data = []
-        for index in frame.index:
-            data.append({
-                'x': str(frame.loc[index, 'intensity'].item()),
-                'y': str(frame.loc[index, 'intensity_hat'].item()),
-            })
-        return tuple(data)
+        return x, y
 
     @classmethod
     def default(cls) -> str:
-        root = ElementTree.Element('columns')
+        buffer = StringIO()
 
-        ElementTree.SubElement(root, 'message', text='Absorption correction failed!')
-        ElementTree.SubElement(root, 'message', text='Open `${ATOM_PATH}/Data/.log` to more information.')
+        write_messages(buffer, messages=[
+            'Absorption correction failed!',
+            'Open `${ATOM_PATH}/Data/.log` to more information.',
+        ])
 
-        reparsed = minidom.parseString(
-            string=ElementTree.tostring(root, encoding='utf-8'),
-        )
-
-        xml = reparsed.toprettyxml(indent='', encoding='utf-8').decode('utf-8')
-        return xml
+        return buffer.getvalue()
 
     def dump(
         self,
         report: str,
         filename: str | None = None,
-    ) -> None:
+    ) -> Future:
         filename = filename or 'results'
 
-        filepath = f'{filename}.xml'
-        with open(filepath, 'w') as file:
-            file.write(report)
+        future = self._executor.submit(
+            self._dump,
+            report=report,
+            filepath=Path(f'{filename}.xml').resolve(),
+        )
+        future.add_done_callback(_log_dump_error)
+        self._futures.append(future)
+
+        return future
+
+    def flush(
+        self,
+        timeout: float | None = None,
+    ) -> None:
+        """Wait for all dumps are completed."""
+
+        futures, self._futures = self._futures, []
+        wait(futures, timeout=timeout)
+
+    def _dump(
+        self,
+        report: str,
+        filepath: Path,
+    ) -> None:
+
+        with TRACER.span('dump', n_bytes=len(report)):
+            write_atomic(filepath, report)
+
+            if self.plugin_config.report_history_size > 0:
+                archive(
+                    filepath,
+                    report,
+                    directory=Path(self.plugin_config.report_history_dir).resolve(),
+                    max_size=self.plugin_config.report_history_size,
+                )
+
+        LOGGER.debug('Report is dumped to: %r', str(filepath))
+
+
+def is_changed(
+    datum: AtomDatum,
+    bounds: tuple[R, R],
+    polynom: tuple[Array[float], Array[float]],
+    rtol: float = RTOL,
+) -> bool:
+    """Check `bounds` and `polynom` are changed in comparison with previous ones of `datum`."""
+
+    if (datum.bounds is None) or (datum.polynom is None):
+        return True
+    if not np.allclose(datum.bounds, bounds, rtol=rtol, atol=0):
+        return True
+
+    previous = np.array(datum.polynom, dtype=float).reshape(-1, 2).T
+    current = np.array(polynom, dtype=float)
+    if previous.shape != current.shape:
+        return True
+    return not np.allclose(previous, current, rtol=rtol, atol=0, equal_nan=True)
 
 
-def wrap(__data) -> str:
-    root = ElementTree.Element('columns')
+def _log_dump_error(future: Future) -> None:
 
-    for datum in __data:
-        column = ElementTree.SubElement(root, 'column', id=datum['id'], nickname=datum['nickname'])
+    error = future.exception()
+    if error is not None:
+        LOGGER.error('Dump report failed: %r', error)
 
-        ElementTree.SubElement(column, 'bounds', **datum['bounds'])
 
-        polynom = ElementTree.SubElement(column, 'polynom')
-        for point in datum['polynom']:
-            ElementTree.SubElement(polynom, 'point', **point)
+def wrap(__data, compact: bool = False) -> str:
+    buffer = StringIO()
 
-    reparsed = minidom.parseString(
-        string=ElementTree.tostring(root, encoding='utf-8'),
-    )
+    write_report(buffer, columns=__data, compact=compact)
 
-    xml = reparsed.toprettyxml(indent='', encoding='utf-8').decode('utf-8')
-    return xml
+    return buffer.getvalue()
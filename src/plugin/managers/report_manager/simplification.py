@@ -0,0 +1,77 @@
+import logging
+
+import numpy as np
+
+from plugin.core.approximation import estimate_error
+from spectrumlab.peaks.analyte_peaks.intensity.transformers import (
+    RegressionIntensityTransformer,
+)
+from spectrumlab.types import Array
+
+
+LOGGER = logging.getLogger('plugin-absorption-correction')
+
+DEFAULT_N_SAMPLES = 16
+
+
+def simplify_polynom(
+    x: Array[float],
+    y: Array[float],
+    transformer: RegressionIntensityTransformer,
+    tolerance: float,
+    n_samples: int = DEFAULT_N_SAMPLES,
+) -> tuple[Array[float], Array[float]]:
+    """Select the smallest subset of polynom's points reproducing `transformer` within relative `tolerance`."""
+
+    mask = np.isfinite(x) & np.isfinite(y)
+    x, index = np.unique(x[mask], return_index=True)
+    y = y[mask][index]
+
+    n_points = len(x)
+    if n_points <= 2:
+        return x, y
+
+    # samples of exact transformer between the points
+    ratio = np.arange(1, n_samples + 1) / (n_samples + 1)
+    grid = np.concatenate([
+        x,
+        (x[:-1, np.newaxis] + (x[1:] - x[:-1])[:, np.newaxis] * ratio).ravel(),
+    ])
+    order = np.argsort(grid, kind='stable')
+    grid = grid[order]
+    exact = np.asarray(transformer.apply(grid), dtype=float)
+    position = np.argsort(order)[:n_points]  # positions of the points in grid
+
+    def is_valid(i: int, j: int) -> bool:
+        if j == i + 1:
+            return True
+
+        lb, ub = position[i], position[j] + 1
+        chord = np.interp(grid[lb:ub], x[[i, j]], y[[i, j]])
+        return np.all(estimate_error(chord, exact[lb:ub], fp=y) <= tolerance)
+
+    # shortest path over points (each segment is valid)
+    cost = np.full(n_points, n_points)
+    parent = np.zeros(n_points, dtype=int)
+    cost[0] = 0
+    for j in range(1, n_points):
+        for i in range(j):
+            if cost[i] + 1 < cost[j] and is_valid(i, j):
+                cost[j], parent[j] = cost[i] + 1, i
+
+    index = [n_points - 1]
+    while index[-1] != 0:
+        index.append(parent[index[-1]])
+    index = index[::-1]
+
+    # verify against exact transformer (between samples used for simplification)
+    middle = (grid[:-1] + grid[1:]) / 2
+    exact = np.asarray(transformer.apply(middle), dtype=float)
+
+    error = estimate_error(np.interp(middle, x[index], y[index]), exact, fp=y)
+    limit = np.maximum(estimate_error(np.interp(middle, x, y), exact, fp=y), tolerance)
+    if np.any(error > limit):
+        LOGGER.warning('Polynom simplification is not verified: %.2e!', np.max(error - limit))
+        return x, y
+
+    return x[index], y[index]
@@ -0,0 +1,73 @@
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+
+def write_atomic(
+    filepath: Path,
+    text: str,
+) -> None:
+    """Write `text` to temporary file and rename it to `filepath`."""
+
+    file = tempfile.NamedTemporaryFile(
+        'w',
+        encoding='utf-8',
+        dir=filepath.parent,
+        prefix='.{}.'.format(filepath.name),
+        suffix='.tmp',
+        delete=False,
+    )
+    try:
+        with file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(file.name, filepath)
+
+    except BaseException:
+        if os.path.exists(file.name):
+            os.remove(file.name)
+        raise
+
+
+def archive(
+    filepath: Path,
+    text: str,
+    directory: Path,
+    max_size: int,
+) -> Path:
+    """Write `text` to `directory` with history of reports and remove the oldest ones to keep `max_size` (in bytes)."""
+
+    directory.mkdir(parents=True, exist_ok=True)
+
+    path = directory / '{stem}-{timestamp}{suffix}'.format(
+        stem=filepath.stem,
+        timestamp=datetime.now().strftime('%Y%m%d-%H%M%S-%f'),
+        suffix=filepath.suffix,
+    )
+    write_atomic(path, text)
+
+    rotate(
+        directory,
+        pattern='{stem}-*{suffix}'.format(stem=filepath.stem, suffix=filepath.suffix),
+        max_size=max_size,
+    )
+    return path
+
+
+def rotate(
+    directory: Path,
+    pattern: str,
+    max_size: int,
+) -> None:
+    """Remove the oldest files matching `pattern` in `directory` while their total size exceeds `max_size`."""
+
+    paths = sorted(directory.glob(pattern), reverse=True)
+
+    size = 0
+    for i, path in enumerate(paths):
+        size += path.stat().st_size
+        if i > 0 and size > max_size:
+            path.unlink(missing_ok=True)
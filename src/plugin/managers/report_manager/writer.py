@@ -0,0 +1,113 @@
+from base64 import b64encode
+from collections.abc import Mapping, Sequence
+from typing import TextIO
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from spectrumlab.types import Array
+
+
+DECLARATION = '<?xml version="1.0" encoding="utf-8"?>\n'
+ENTITIES = {'"': '&quot;'}
+COMPACT_DTYPE = np.dtype('<f8')
+
+
+def write_report(
+    file: TextIO,
+    columns: Sequence[Mapping],
+    compact: bool = False,
+) -> None:
+    """Write report with given `columns` to `file` (same formatting as `minidom.toprettyxml(indent='')`)."""
+
+    file.write(DECLARATION)
+    if not columns:
+        file.write('<columns/>\n')
+        return None
+
+    file.write('<columns>\n')
+    for column in columns:
+        write_column(file, column, compact=compact)
+    file.write('</columns>\n')
+
+
+def write_column(
+    file: TextIO,
+    column: Mapping,
+    compact: bool = False,
+) -> None:
+
+    if column.get('unchanged'):
+        attributes = format_attributes(id=column['id'], nickname=column['nickname'], unchanged='yes')
+        file.write('<column{}/>\n'.format(attributes))
+        return None
+
+    file.write('<column{}>\n'.format(format_attributes(id=column['id'], nickname=column['nickname'])))
+    file.write('<bounds{}/>\n'.format(format_attributes(**column['bounds'])))
+    if compact:
+        write_compact_polynom(file, *column['polynom'])
+    else:
+        write_polynom(file, *column['polynom'])
+    file.write('</column>\n')
+
+
+def write_polynom(
+    file: TextIO,
+    x: Array[float],
+    y: Array[float],
+) -> None:
+
+    if len(x) == 0:
+        file.write('<polynom/>\n')
+        return None
+
+    file.write('<polynom>\n')
+    file.writelines(map('<point x="{}" y="{}"/>\n'.format, format_numbers(x), format_numbers(y)))
+    file.write('</polynom>\n')
+
+
+def write_compact_polynom(
+    file: TextIO,
+    x: Array[float],
+    y: Array[float],
+) -> None:
+    """Write polynom with `x` and `y` packed to base64 (as `yvals` of Atom's table)."""
+
+    file.write('<polynom{}>\n'.format(format_attributes(encoding='base64', dtype=COMPACT_DTYPE.name)))
+    for tag, values in (('xvals', x), ('yvals', y)):
+        values = np.ascontiguousarray(values, dtype=COMPACT_DTYPE)
+        file.write('<{tag}{attributes}>{text}</{tag}>\n'.format(
+            tag=tag,
+            attributes=format_attributes(value_array_size=str(len(values))),
+            text=b64_from_numpy_array(values),
+        ))
+    file.write('</polynom>\n')
+
+
+def write_messages(
+    file: TextIO,
+    messages: Sequence[str],
+) -> None:
+
+    file.write(DECLARATION)
+    file.write('<columns>\n')
+    for message in messages:
+        file.write('<message{}/>\n'.format(format_attributes(text=message)))
+    file.write('</columns>\n')
+
+
+def format_attributes(**attributes: str) -> str:
+    return ''.join(
+        ' {}="{}"'.format(key, escape(value, ENTITIES))
+        for key, value in attributes.items()
+    )
+
+
+def format_numbers(values: Array[float]) -> Array[str]:
+    """Format `values` in bulk (same as `str` of each value)."""
+
+    return np.asarray(values, dtype=float).astype(str)
+
+
+def b64_from_numpy_array(array: Array) -> str:
+    return b64encode(array.tobytes()).decode('ascii')
@@ -1,6 +1,9 @@
 from typing import Self
 
 from plugin.config import PLUGIN_CONFIG
+from plugin.diagnostics import PROFILER, TRACER
+from plugin.diagnostics.journal import create_record, write_record
+from plugin.diagnostics.memory import get_peak_rss
 from plugin.exceptions import exception_wrapper
 from plugin.managers.correction_manager import CorrectionManager
 from plugin.managers.data_manager import DataManager
@@ -38,22 +41,51 @@ class Plugin:
         self.correction_manager = correction_manager
         self.report_manager = report_manager
 
+        self._atom_data = None  # data of the last run (to write its metrics on flush)
+
     @exception_wrapper
     def run(
         self,
         xml: XML,
     ) -> str:
 
-        atom_data = self.data_manager.parse(
-            xml=xml,
-        )
-        transformers = self.correction_manager.retrieve(
-            data=atom_data.data,
-        )
-        report = self.report_manager.build(
-            data=atom_data.data,
-            transformers=transformers,
-            dump=True,
-        )
+        TRACER.reset()
+        with TRACER.span('run'):
+            atom_data = self.data_manager.parse(
+                xml=xml,
+            )
+            PROFILER.set_filepath(atom_data.filepath)
+            transformers = self.correction_manager.retrieve(
+                data=atom_data.data,
+            )
+            if self.correction_manager.plugin_config.linearize_transients:
+                self.correction_manager.linearize(
+                    data=atom_data.data,
+                )
+            report = self.report_manager.build(
+                data=atom_data.data,
+                transformers=transformers,
+                aggregated=self.correction_manager.aggregated,
+                dump=True,
+            )
 
+        self._atom_data = atom_data
         return report
+
+    def flush(self) -> None:
+        """Wait for dumps of the report and write metrics of the run to journal (all spans of the run are closed)."""
+
+        self.report_manager.flush()
+
+        atom_data, self._atom_data = self._atom_data, None
+        if PLUGIN_CONFIG.metrics_journal and (atom_data is not None):
+            write_record(
+                create_record(
+                    atom_data,
+                    durations=TRACER.durations(),
+                    peak_rss=get_peak_rss(),
+                    cache_hits=self.correction_manager.n_cache_hits,
+                ),
+                filepath=PLUGIN_CONFIG.metrics_journal_filepath,
+                max_size=PLUGIN_CONFIG.metrics_journal_size,
+            )
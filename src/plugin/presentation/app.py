@@ -4,6 +4,7 @@ from typing import Callable
 
 from PySide6 import QtWidgets
 
+from plugin.diagnostics import PROFILER
 from plugin.dto import AtomDatum
 from plugin.presentation.windows import PreviewWindow
 from spectrumlab.types import Frame, R
@@ -31,7 +32,8 @@ def retrieve_transformer(
         )
 
     try:
-        app.exec()
+        with PROFILER.pause_event_loop():
+            app.exec()
     except Exception:
         raise
     else:
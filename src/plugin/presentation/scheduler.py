@@ -0,0 +1,89 @@
+from collections.abc import Hashable, Mapping
+from typing import Callable
+
+from PySide6 import QtCore
+
+from plugin.config import PLUGIN_CONFIG
+
+
+class RedrawScheduler(QtCore.QObject):
+    """Coalesce pending events of each widget and handle them at most `fps` times per second.
+
+    The `timer` is created by default; it is to be replaced by a fake one in tests.
+    """
+
+    def __init__(self, *args, fps: int, timer: QtCore.QTimer | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._pending: dict[tuple[Hashable, str], Callable[[], None]] = {}
+
+        self._timer = QtCore.QTimer(self) if timer is None else timer
+        self._timer.setInterval(max(int(1000 / fps), 1))
+        self._timer.timeout.connect(self.flush)
+
+        self.n_scheduled = 0
+        self.n_coalesced = 0
+        self.n_dropped = 0
+        self.n_executed = 0
+
+    def schedule(
+        self,
+        owner: Hashable,
+        kind: str,
+        callback: Callable[[], None],
+    ) -> None:
+        """Schedule `callback` of `owner`'s event. Pending callback of the same kind is replaced."""
+
+        key = (owner, kind)
+
+        self.n_scheduled += 1
+        if key in self._pending:
+            self.n_coalesced += 1
+        self._pending[key] = callback
+
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def cancel(
+        self,
+        owner: Hashable,
+    ) -> None:
+        """Drop pending callbacks of `owner`."""
+
+        for key in [key for key in self._pending if key[0] is owner]:
+            del self._pending[key]
+            self.n_dropped += 1
+
+    def flush(self) -> None:
+        """Handle all pending callbacks."""
+
+        pending, self._pending = self._pending, {}
+        if not pending:
+            self._timer.stop()
+            return None
+
+        for callback in pending.values():
+            callback()
+            self.n_executed += 1
+
+    def stats(self) -> Mapping[str, int]:
+        return {
+            'scheduled': self.n_scheduled,
+            'coalesced': self.n_coalesced,
+            'dropped': self.n_dropped,
+            'executed': self.n_executed,
+        }
+
+
+SCHEDULER: RedrawScheduler | None = None
+
+
+def get_scheduler() -> RedrawScheduler:
+    global SCHEDULER
+
+    if SCHEDULER is None:
+        SCHEDULER = RedrawScheduler(
+            fps=PLUGIN_CONFIG.preview_fps,
+        )
+
+    return SCHEDULER
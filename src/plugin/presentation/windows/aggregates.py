@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Self
+
+import pandas as pd
+
+from plugin.presentation.windows.lod import summarize
+from spectrumlab.types import Frame
+
+
+COLUMNS = ['concentration', 'intensity', 'intensity_true', 'intensity_linearized']
+
+
+@dataclass(frozen=True)
+class FrameAggregates:
+    """Aggregates of processed frame shared by preview widgets (computed once per fit)."""
+
+    frame: Frame
+    mean: Frame
+    residual: Frame
+    mean_residual: Frame
+
+    @classmethod
+    def create(cls, frame: Frame) -> Self:
+        frame = frame[COLUMNS]
+        mean = frame.groupby(level=0, sort=False).mean()
+
+        return cls(
+            frame=frame,
+            mean=mean,
+            residual=calculate_residual(frame),
+            mean_residual=calculate_residual(mean),
+        )
+
+    @cached_property
+    def summary(self) -> Frame:
+        """Per-probe quantiles of parallels (computed on demand of level-of-detail rendering)."""
+        return summarize(self.frame)
+
+    @cached_property
+    def residual_summary(self) -> Frame:
+        """Per-probe quantiles of parallels' residuals (computed on demand of level-of-detail rendering)."""
+        return summarize(pd.concat([self.frame['concentration'], self.residual], axis=1))
+
+
+def calculate_residual(frame: Frame) -> Frame:
+    """Calculate relative residuals (in percent) of recorded and linearized intensities."""
+
+    intensity = frame[['intensity', 'intensity_linearized']]
+    intensity_true = frame['intensity_true']
+
+    return 100 * intensity.sub(intensity_true, axis=0).div(intensity_true, axis=0)
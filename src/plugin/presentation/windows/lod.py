@@ -0,0 +1,59 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from spectrumlab.types import Array, Frame
+
+
+QUANTILES = (0, .1, .5, .9, 1)
+DECIMATION_CELL = 2  # in pixels
+
+
+def summarize(
+    frame: Frame,
+    quantiles: Sequence[float] = QUANTILES,
+) -> Frame:
+    """Summarize parallels of each probe by `quantiles` (min, q10, median, q90 and max by default)."""
+
+    return frame.groupby(level=0, sort=False).quantile(list(quantiles))
+
+
+def find_visible(
+    xy: Array[float],
+    bounds: tuple[float, float, float, float],
+) -> Array[int]:
+    """Find indices of `xy` points (in display coordinates) within view's `bounds`."""
+
+    x0, y0, width, height = bounds
+
+    with np.errstate(invalid='ignore'):
+        mask_x = (xy[:, 0] >= x0) & (xy[:, 0] <= x0 + width)
+        mask_y = (xy[:, 1] >= y0) & (xy[:, 1] <= y0 + height)
+    mask = mask_x & mask_y
+    return np.flatnonzero(mask)
+
+
+def decimate(
+    xy: Array[float],
+    index: Array[int],
+    cell_size: float = DECIMATION_CELL,
+) -> Array[int]:
+    """Decimate `xy` points (in display coordinates) with given `index` keeping one point per cell of `cell_size`.
+
+    The lowest and the highest points of each column of cells are kept too, so extremes are not lost.
+    """
+
+    if len(index) == 0:
+        return index
+
+    cells = np.floor(xy[index] / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0)
+
+    _, first = np.unique(cells[:, 1] * (cells[:, 0].max() + 1) + cells[:, 0], return_index=True)
+
+    # extremes of each column
+    order = np.lexsort((xy[index, 1], cells[:, 0]))
+    _, lower = np.unique(cells[order, 0], return_index=True)
+    upper = np.append(lower[1:], len(order)) - 1
+
+    return index[np.unique(np.concatenate([first, order[lower], order[upper]]))]
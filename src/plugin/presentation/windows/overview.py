@@ -0,0 +1,266 @@
+import logging
+import threading
+from collections.abc import Mapping, Sequence
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from io import BytesIO
+
+import numpy as np
+from PySide6 import QtCore, QtGui, QtWidgets
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from plugin.presentation.windows.aggregates import FrameAggregates
+from spectrumlab.picture.colors import COLOR
+from spectrumlab.types import Frame, R
+
+
+LOGGER = logging.getLogger('plugin-absorption-correction')
+
+THUMBNAIL_SIZE = (160, 120)  # in pixels
+THUMBNAIL_DPI = 100
+DEFAULT_N_COLS = 5
+
+
+@dataclass(frozen=True)
+class Thumbnail:
+    png: bytes
+    metrics: Mapping[str, float]
+
+
+def create_thumbnail(
+    frame: Frame,
+    bounds: tuple[R, R] | None,
+) -> Thumbnail:
+    aggregates = FrameAggregates.create(frame)
+
+    return Thumbnail(
+        png=render_thumbnail(aggregates, bounds=bounds),
+        metrics=calculate_metrics(aggregates),
+    )
+
+
+def render_thumbnail(
+    aggregates: FrameAggregates,
+    bounds: tuple[R, R] | None,
+    size: tuple[int, int] = THUMBNAIL_SIZE,
+) -> bytes:
+    """Render thumbnail of probes' means to PNG (with Agg backend, so it can be called off the UI thread).
+
+    Matplotlib is not thread-safe, so thumbnails are rendered by a single worker one at a time.
+    """
+
+    width, height = size
+
+    figure = Figure(figsize=(width / THUMBNAIL_DPI, height / THUMBNAIL_DPI), dpi=THUMBNAIL_DPI)
+    FigureCanvasAgg(figure)
+
+    ax = figure.add_axes((0, 0, 1, 1))
+    mean = aggregates.mean.sort_values('concentration')
+    ax.plot(
+        mean['concentration'], mean['intensity_true'],
+        color='black', linestyle=':',
+        alpha=.5,
+    )
+    ax.scatter(
+        mean['concentration'], mean['intensity'],
+        s=8,
+        marker='s',
+        color=COLOR['green'],
+        alpha=.5,
+    )
+    ax.scatter(
+        mean['concentration'], mean['intensity_linearized'],
+        s=8,
+        marker='s',
+        color=COLOR['red'],
+        alpha=.5,
+    )
+    if bounds is not None:
+        ax.axhspan(
+            *bounds,
+            alpha=.125, color=COLOR['red'],
+        )
+
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.tick_params(which='both', bottom=False, left=False, labelbottom=False, labelleft=False)
+
+    buffer = BytesIO()
+    figure.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+
+def calculate_metrics(aggregates: FrameAggregates) -> Mapping[str, float]:
+    """Calculate max and rms of probes' residuals (in percent) of linearized intensity."""
+
+    residual = aggregates.mean_residual['intensity_linearized'].abs()
+
+    return {
+        'n_probes': len(residual),
+        'max': residual.max(),
+        'rms': np.sqrt((residual**2).mean()),
+    }
+
+
+class ThumbnailRenderer(QtCore.QObject):
+    """Render thumbnails in a worker thread and cache them by column's id and bounds."""
+
+    rendered = QtCore.Signal(str, object)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='thumbnail-renderer')
+        self._cache: dict[tuple[str, tuple[R, R] | None], Thumbnail] = {}
+        self._expected: dict[str, tuple[str, tuple[R, R] | None]] = {}
+
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def submit(
+        self,
+        column_id: str,
+        frame: Frame,
+        bounds: tuple[R, R] | None,
+    ) -> None:
+        if self._closed:
+            return None
+
+        key = (column_id, bounds)
+        self._expected[column_id] = key
+
+        if key in self._cache:
+            self.rendered.emit(column_id, self._cache[key])
+            return None
+
+        future = self._executor.submit(create_thumbnail, frame, bounds)
+        future.add_done_callback(partial(self._done, key))
+
+    def shutdown(self) -> None:
+        """Cancel pending thumbnails. Thumbnails rendered after shutdown are not emitted."""
+
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _done(
+        self,
+        key: tuple[str, tuple[R, R] | None],
+        future: Future,
+    ) -> None:
+        """Cache rendered thumbnail and emit it to the UI thread (skip outdated one)."""
+
+        try:
+            thumbnail = future.result()
+        except CancelledError:
+            return None
+        except Exception:
+            LOGGER.exception('Thumbnail of column %r is not rendered!', key[0])
+            return None
+
+        with self._lock:
+            if self._closed:
+                return None
+
+            self._cache[key] = thumbnail
+
+            column_id, _ = key
+            if self._expected.get(column_id) == key:
+                self.rendered.emit(column_id, thumbnail)
+
+
+class ThumbnailWidget(QtWidgets.QToolButton):
+
+    def __init__(self, *args, column_id: str, nickname: str, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.column_id = column_id
+        self.nickname = nickname
+
+        self.setToolButtonStyle(QtCore.Qt.ToolButtonTextUnderIcon)
+        self.setIconSize(QtCore.QSize(*THUMBNAIL_SIZE))
+        self.setText(nickname)
+
+    def update(
+        self,
+        thumbnail: Thumbnail,
+    ) -> None:
+        pixmap = QtGui.QPixmap()
+        pixmap.loadFromData(thumbnail.png, 'PNG')
+        self.setIcon(QtGui.QIcon(pixmap))
+
+        self.setText('{}\nmax: {:.1f}%, rms: {:.1f}%'.format(
+            self.nickname,
+            thumbnail.metrics['max'],
+            thumbnail.metrics['rms'],
+        ))
+
+
+class OverviewWidget(QtWidgets.QScrollArea):
+    """Grid of columns' thumbnails with residual metrics. Click on thumbnail activates column's tab."""
+
+    activated = QtCore.Signal(str)
+
+    def __init__(
+        self,
+        *args,
+        column_ids: Sequence[str],
+        nicknames: Sequence[str],
+        n_cols: int = DEFAULT_N_COLS,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.column_id = None
+
+        self.renderer = ThumbnailRenderer(self)
+        self.renderer.rendered.connect(self._rendered)
+
+        # layout
+        content = QtWidgets.QWidget()
+        layout = QtWidgets.QGridLayout(content)
+        layout.setContentsMargins(5, 5, 5, 5)
+        layout.setSpacing(5)
+
+        self._thumbnails = {}
+        for i, (column_id, nickname) in enumerate(zip(column_ids, nicknames)):
+            widget = ThumbnailWidget(column_id=column_id, nickname=nickname[::-1])
+            widget.clicked.connect(partial(self._clicked, column_id))
+            layout.addWidget(widget, i // n_cols, i % n_cols)
+
+            self._thumbnails[column_id] = widget
+
+        self.setWidget(content)
+        self.setWidgetResizable(True)
+
+    def update(
+        self,
+        column_id: str,
+        frame: Frame,
+        bounds: tuple[R, R] | None,
+    ) -> None:
+        self.renderer.submit(
+            column_id=column_id,
+            frame=frame,
+            bounds=bounds,
+        )
+
+    def _rendered(
+        self,
+        column_id: str,
+        thumbnail: Thumbnail,
+    ) -> None:
+        self._thumbnails[column_id].update(thumbnail)
+
+    def _clicked(
+        self,
+        column_id: str,
+        *args,
+    ) -> None:
+        self.activated.emit(column_id)
@@ -0,0 +1,73 @@
+from collections.abc import Hashable
+
+import numpy as np
+
+from spectrumlab.types import Array
+
+
+class PointIndex:
+    """Uniform grid index of points (in display coordinates) to find the nearest one."""
+
+    def __init__(
+        self,
+        xy: Array[float],
+        cell_size: float,
+        key: Hashable | None = None,
+    ) -> None:
+        xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+
+        self.xy = xy
+        self.cell_size = cell_size
+        self.key = key
+
+        index = np.flatnonzero(np.all(np.isfinite(xy), axis=1))
+        cells = np.floor(xy[index] / cell_size).astype(np.int64)
+
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        index, cells = index[order], cells[order]
+
+        unique, start = np.unique(cells, axis=0, return_index=True)
+        stop = np.append(start[1:], len(cells))
+
+        self._index = index
+        self._cells = {
+            (cx, cy): (lb, ub)
+            for (cx, cy), lb, ub in zip(unique.tolist(), start.tolist(), stop.tolist())
+        }
+
+    def query(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+    ) -> int | None:
+        """Find index of the nearest point within given `radius` from (`x`, `y`).
+
+        Ties are resolved to the lowest index.
+        """
+
+        cx, cy = int(np.floor(x / self.cell_size)), int(np.floor(y / self.cell_size))
+        n = int(np.ceil(radius / self.cell_size))
+
+        candidates = [
+            self._index[slice(*self._cells[cell])]
+            for cell in (
+                (cx + i, cy + j)
+                for i in range(-n, n + 1)
+                for j in range(-n, n + 1)
+            )
+            if cell in self._cells
+        ]
+        if not candidates:
+            return None
+
+        candidates = np.sort(np.concatenate(candidates))
+        distance = np.hypot(self.xy[candidates, 0] - x, self.xy[candidates, 1] - y)
+
+        i = np.argmin(distance)
+        if distance[i] > radius:
+            return None
+        return candidates[i].item()
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -1,27 +1,49 @@
+import logging
 import os
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Callable, NewType
 
 import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
-from matplotlib.backend_bases import KeyEvent, MouseEvent, PickEvent
+from matplotlib.artist import Artist
+from matplotlib.backend_bases import DrawEvent, KeyEvent, MouseEvent, PickEvent
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 
 import plugin
+from plugin.config import PLUGIN_CONFIG
+from plugin.diagnostics import LATENCY
 from plugin.dto import AtomDatum
+from plugin.managers.data_manager.exceptions import DataManagerError
+from plugin.managers.data_manager.parsers.atom_data_parser import parse_bad
+from plugin.presentation.scheduler import get_scheduler
+from plugin.presentation.windows.aggregates import FrameAggregates
+from plugin.presentation.windows.lod import decimate, find_visible
+from plugin.presentation.windows.overview import OverviewWidget
+from plugin.presentation.windows.point_index import PointIndex
+from plugin.presentation.windows.pyramid import Pyramid
 from spectrumapp.helpers import find_tab, getdefault_object_name
 from spectrumapp.types import Lims
 from spectrumapp.widgets.graph_widget import MplCanvas
 from spectrumlab.picture.alphas import ALPHA
 from spectrumlab.picture.colors import COLOR
-from spectrumlab.types import Frame, R
+from spectrumlab.types import Array, Frame, R
+
+
+LOGGER = logging.getLogger('plugin-absorption-correction')
 
 Index = NewType('Index', str)
 
 DEFAULT_SIZE = QtCore.QSize(640, 480)
+GRAPH_SIZE = QtCore.QSize(480, 480)  # size of graphs of column's tab
+TAB_MARGINS = (5, 5, 5, 5)
+TAB_SPACING = 5
 DEFAULT_LIMS = ((0, 1), (0, 1))
+DEFAULT_RADIUS = 8  # in pixels
 
 
 @dataclass
@@ -44,13 +66,19 @@ class BaseGraphWidget(QtWidgets.QWidget):
 
         self._widget_size = size
 
-        self._frame = None
+        self._aggregates = None
+        self._artists = None
+        self._point_index = None
+        self._hit_data = None
+        self._hovered = None
+        self._hover_annotation = None
         self._point_labels = None
         self._axis_labels = None
         self._point_annotation = None
         self._zoom_region = None
         self._full_lims = None
         self._cropped_lims = None
+        self._data_lims = None
 
         # object name
         object_name = object_name or getdefault_object_name(self)
@@ -72,8 +100,13 @@ class BaseGraphWidget(QtWidgets.QWidget):
         self.canvas.mpl_connect('button_press_event', self._button_press_event)
         self.canvas.mpl_connect('button_release_event', self._button_release_event)
         self.canvas.mpl_connect('motion_notify_event', self._motion_notify_event)
+        self.canvas.mpl_connect('draw_event', self._draw_event)
         layout.addWidget(self.canvas)
 
+        # blitting
+        self._blitted = None
+        self._background = None
+
         # pressed mouse and keys events
         self._mouse_event: MouseEvent | None = None
         self._ctrl_modified = False
@@ -110,12 +143,17 @@ class BaseGraphWidget(QtWidgets.QWidget):
     def shift_modified(self) -> bool:
         return self._shift_modified
 
+    @property
+    def aggregates(self) -> FrameAggregates | None:
+        return self._aggregates
+
     def update(
         self,
-        frame: AtomDatum,
+        aggregates: FrameAggregates,
     ) -> None:
 
-        self._frame = frame.groupby(level=0, sort=False).mean().apply(lambda x: np.log10(x))
+        self._aggregates = aggregates
+        self._point_index = None
 
     def update_zoom(self, lims: Lims | None = None) -> None:
         """Update zoom to given `lims`."""
@@ -124,6 +162,86 @@ class BaseGraphWidget(QtWidgets.QWidget):
 
         self.canvas.axes.set_xlim(xlim)
         self.canvas.axes.set_ylim(ylim)
+        self.update_lod()
+        self.canvas.draw_idle()
+
+    def update_lod(self) -> None:
+        """Update level-of-detail of parallels to the current view.
+
+        Dense parallels are drawn as per-probe quantiles in full view and as a decimated subset in cropped view;
+        full detail is drawn, if the number of points in view is below `PREVIEW_LOD_THRESHOLD`.
+        """
+        if self.aggregates is None:
+            return None
+
+        threshold = PLUGIN_CONFIG.preview_lod_threshold
+        dense = (threshold > 0) and (len(self.aggregates.frame) > threshold)
+        summarized = dense and (self.cropped_lims is None)
+
+        ax = self.canvas.axes
+        for name, xy in self._parallels(summarized=summarized).items():
+            if dense and not summarized:
+                display = ax.transData.transform(xy)
+
+                index = find_visible(display, bounds=ax.bbox.bounds)
+                if len(index) > threshold:
+                    index = decimate(display, index=index)
+                xy = xy[index]
+
+            self._artists[name].set_offsets(xy)
+
+    def autoscale(
+        self,
+        xy: Array[float],
+        scaley: bool = True,
+    ) -> None:
+        """Autoscale view to given `xy` points, if data lims are changed."""
+
+        xy = xy[np.all(np.isfinite(xy), axis=1)]
+
+        lims = (tuple(xy.min(axis=0)), tuple(xy.max(axis=0))) if len(xy) > 0 else None
+        if lims == self._data_lims:
+            return None
+        self._data_lims = lims
+        self._full_lims = None
+
+        if self.cropped_lims is not None:
+            return None
+
+        ax = self.canvas.axes
+        ax.ignore_existing_data_limits = True
+        if len(xy) > 0:
+            ax.update_datalim(xy)
+        ax.autoscale_view(scaley=scaley)
+
+    def start_blit(self, artist: Artist) -> None:
+        """Start to redraw given `artist` only (over cached background)."""
+
+        artist.set_animated(True)
+
+        self._blitted = artist
+        self.canvas.draw()  # background is cached by `draw_event`
+
+    def blit(self) -> None:
+        """Redraw blitted artist over cached background."""
+
+        if self._background is None:
+            self.canvas.draw_idle()
+            return None
+
+        self.canvas.restore_region(self._background)
+        self.figure.draw_artist(self._blitted)
+        self.canvas.blit(self.figure.bbox)  # repaints synchronously (unlike `draw_idle`)
+        LATENCY.stop(self)
+
+    def stop_blit(self) -> None:
+        """Stop to redraw blitted artist and remove it."""
+
+        if self._blitted is not None:
+            self._blitted.remove()
+
+        self._blitted = None
+        self._background = None
         self.canvas.draw_idle()
 
     def set_full_lims(self, lims: Lims) -> None:
@@ -178,28 +296,97 @@ class BaseGraphWidget(QtWidgets.QWidget):
     ) -> None:
         return None
 
+    def _hit_points(self) -> tuple[Array[float], Array[float], Sequence[Index]]:
+        """Points (in data coordinates) and labels available to hit-testing."""
+        raise NotImplementedError
+
+    def _parallels(self, summarized: bool = False) -> Mapping[str, Array[float]]:
+        """Points of parallels (or its per-probe quantiles, if `summarized`) in data coordinates by artist's name."""
+        raise NotImplementedError
+
+    def _find_point(
+        self,
+        event: MouseEvent,
+        radius: float = DEFAULT_RADIUS,
+    ) -> tuple[float, float, Index] | None:
+        """Find the nearest point within `radius` (in pixels) from `event`."""
+
+        if self.aggregates is None:
+            return None
+
+        # update index, if view is changed
+        ax = self.canvas.axes
+        key = (ax.viewLim.bounds, ax.bbox.bounds)
+        if (self._point_index is None) or (self._point_index.key != key):
+            x, y, labels = self._hit_points()
+
+            self._point_index = PointIndex(
+                ax.transData.transform(np.column_stack([x, y])),
+                cell_size=DEFAULT_RADIUS,
+                key=key,
+            )
+            self._hit_data = x, y, labels
+
+        i = self._point_index.query(event.x, event.y, radius=radius)
+        if i is None:
+            return None
+
+        x, y, labels = self._hit_data
+        return x[i].item(), y[i].item(), labels[i]
+
     def _check_point(
         self,
         event: MouseEvent,
-        epsilon: float = .05,
-    ) -> bool:
+        radius: float = DEFAULT_RADIUS,
+    ) -> None:
         ax = self.figure.gca()
 
-        condition = (np.abs((self._frame['concentration'] - np.log10(event.xdata))) < epsilon) & (np.abs((self._frame['intensity'] - np.log10(event.ydata))) < epsilon)
-        matches = self._frame.index[condition]
-        if len(matches) > 0:
-
-            for match in matches:
-                self._point_annotation = ax.text(
-                    event.xdata, event.ydata,
-                    match,
-                    fontsize=10,
-                    ha='center',
-                    va='bottom',
-                )
-                self._point_annotation.set_in_layout(False)
+        match = self._find_point(event, radius=radius)
+        if match is not None:
+            x, y, label = match
+
+            self._point_annotation = ax.text(
+                x, y,
+                label,
+                fontsize=10,
+                ha='center',
+                va='bottom',
+            )
+            self._point_annotation.set_in_layout(False)
             self.canvas.draw_idle()
 
+    def _hover_event(
+        self,
+        event: MouseEvent,
+    ) -> None:
+        match = self._find_point(event) if event.inaxes is not None else None
+        if match == self._hovered:
+            return None
+        self._hovered = match
+
+        if self._hover_annotation is None:
+            ax = self.figure.gca()
+
+            self._hover_annotation = ax.annotate(
+                '',
+                xy=(0, 0),
+                xytext=(0, 5),
+                textcoords='offset points',
+                fontsize=10,
+                ha='center',
+                va='bottom',
+                visible=False,
+            )
+            self._hover_annotation.set_in_layout(False)
+
+        if match is not None:
+            x, y, label = match
+
+            self._hover_annotation.xy = (x, y)
+            self._hover_annotation.set_text(label)
+        self._hover_annotation.set_visible(match is not None)
+        self.canvas.draw_idle()
+
     def _button_press_event(
         self,
         event: MouseEvent,
@@ -225,6 +412,15 @@ class BaseGraphWidget(QtWidgets.QWidget):
             self._mouse_event = None
             self.set_cropped_lims(lims=None)
             self.update_zoom(lims=self.full_lims)
+            return None
+        if event.button == 3:
+            if event.inaxes is not None:
+                self._zoom_region = Rectangle(
+                    (event.xdata, event.ydata), 0, 0,
+                    fill=False, edgecolor='grey', linestyle='--',
+                )
+                self.canvas.axes.add_patch(self._zoom_region)
+                self.start_blit(self._zoom_region)
 
     def _button_release_event(
         self,
@@ -237,6 +433,11 @@ class BaseGraphWidget(QtWidgets.QWidget):
         event: MouseEvent,
     ) -> None:
 
+        # update hover annotation
+        if event.button is None:
+            get_scheduler().schedule(self, 'hover', partial(self._hover_event, event))
+            return None
+
         # update zoom and pan
         if self.ctrl_modified and self.shift_modified:
             return None
@@ -246,18 +447,51 @@ class BaseGraphWidget(QtWidgets.QWidget):
 
         if self.shift_modified:
             if event.button == 1:
-                self._pan_event(
-                    self._mouse_event,
-                    event,
-                )
+                LATENCY.start(self, 'pan')
+                get_scheduler().schedule(self, 'pan', partial(self._pan_event, self._mouse_event, event))
                 return None
 
+        if event.button == 3:
+            if (self._zoom_region is not None) and (event.inaxes is not None):
+                LATENCY.start(self, 'zoom_region')
+                get_scheduler().schedule(self, 'zoom', partial(self._update_zoom_region, event))
+
+    def _update_zoom_region(
+        self,
+        event: MouseEvent,
+    ) -> None:
+
+        if self._zoom_region is None:
+            return None
+
+        x0, y0 = self._zoom_region.get_xy()
+
+        self._zoom_region.set_width(event.xdata - x0)
+        self._zoom_region.set_height(event.ydata - y0)
+        self.blit()
+
+    def _draw_event(
+        self,
+        event: DrawEvent,
+    ) -> None:
+
+        if self._blitted is not None:
+            self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+            self.figure.draw_artist(self._blitted)
+
+        LATENCY.stop(self)
+
     def _zoom_event(
         self,
         press_event: MouseEvent | None,
         release_event: MouseEvent | None,
     ) -> None:
 
+        # update zoom region
+        if self._zoom_region is not None:
+            self._zoom_region = None
+            self.stop_blit()
+
         if (press_event is None) or (release_event is None):
             return None
         if any(
@@ -287,6 +521,7 @@ class BaseGraphWidget(QtWidgets.QWidget):
         )
 
         # update zoom
+        LATENCY.start(self, 'zoom')
         self.update_zoom(
             lims=self.cropped_lims,
         )
@@ -329,81 +564,115 @@ class BaseGraphWidget(QtWidgets.QWidget):
 class RetriverViewWidget(BaseGraphWidget):
 
     def __init__(self, column_id: str) -> None:
-        super().__init__(size=QtCore.QSize(480, 480))
+        super().__init__(size=GRAPH_SIZE)
 
         self.column_id = column_id
 
-        self._frame = None
         self._selection_start = None
         self._selection = None
 
     def update(
         self,
-        frame: AtomDatum,
+        aggregates: FrameAggregates,
         bounds: tuple[R, R] | None,
     ) -> None:
-        super().update(frame=frame)
+        super().update(aggregates=aggregates)
 
-        ax = self.figure.gca()
-        ax.clear()
-
-        x = frame['concentration']
-        y = frame['intensity']
-        ax.scatter(
-            x, y,
-            s=20,
-            marker='s',
-            facecolors='none',
-            edgecolors=[0, 0, 0, 0],
-            alpha=ALPHA['parallel'],
-        )
-        x = frame['concentration'].groupby(level=0, sort=False).mean()
-        y = frame['intensity'].groupby(level=0, sort=False).mean()
-        ax.scatter(
-            x, y,
-            s=40,
-            marker='s',
-            facecolors=COLOR['green'],
-            edgecolors=COLOR['green'],
-            alpha=.5,
-            label='recorded',
-        )
+        if self._artists is None:
+            self._artists = self._create_artists()
 
-        x = frame['concentration']
-        y = frame['intensity_linearized']
-        ax.scatter(
-            x, y,
-            s=20,
-            marker='s',
-            facecolors='none',
-            edgecolors=[0, 0, 0, 0],
-            alpha=ALPHA['parallel'],
-        )
-        x = frame['concentration'].groupby(level=0, sort=False).mean()
-        y = frame['intensity_linearized'].groupby(level=0, sort=False).mean()
-        ax.scatter(
-            x, y,
-            s=40,
-            marker='s',
-            facecolors=COLOR['red'],
-            edgecolors=COLOR['red'],
-            alpha=.5,
-            label='recorded',
-        )
+        frame, mean = aggregates.frame, aggregates.mean
 
-        x, y = frame['concentration'], frame['intensity_true']
-        ax.plot(
-            x, y,
-            color='black', linestyle=':',
-            alpha=.5,
-        )
+        x = frame['concentration'].to_numpy()
+        x_mean = mean['concentration'].to_numpy()
+
+        y = frame['intensity'].to_numpy()
+        y_mean = mean['intensity'].to_numpy()
+        self._artists['intensity_mean'].set_offsets(np.column_stack([x_mean, y_mean]))
+
+        y_linearized = frame['intensity_linearized'].to_numpy()
+        y_mean = mean['intensity_linearized'].to_numpy()
+        self._artists['intensity_linearized_mean'].set_offsets(np.column_stack([x_mean, y_mean]))
+
+        y_true = frame['intensity_true'].to_numpy()
+        self._artists['intensity_true'].set_data(x, y_true)
 
         if bounds is not None:
             lb, ub = bounds
-            ax.axhspan(
-                lb, ub,
+            self._artists['bounds'].set_bounds(0, lb, 1, ub - lb)
+        self._artists['bounds'].set_visible(bounds is not None)
+
+        self.autoscale(
+            np.column_stack([np.tile(x, 3), np.concatenate([y, y_linearized, y_true])]),
+        )
+        self.update_lod()
+        self.canvas.draw_idle()
+
+    def _hit_points(self) -> tuple[Array[float], Array[float], Sequence[Index]]:
+        mean = self.aggregates.mean
+
+        x = np.tile(mean['concentration'].to_numpy(), 2)
+        y = np.concatenate([mean['intensity'].to_numpy(), mean['intensity_linearized'].to_numpy()])
+        labels = np.tile(mean.index.to_numpy(), 2)
+        return x, y, labels
+
+    def _parallels(self, summarized: bool = False) -> Mapping[str, Array[float]]:
+        frame = self.aggregates.summary if summarized else self.aggregates.frame
+
+        return {
+            key: frame[['concentration', key]].to_numpy()
+            for key in ['intensity', 'intensity_linearized']
+        }
+
+    def _create_artists(self) -> Mapping[str, Artist]:
+        ax = self.figure.gca()
+
+        artists = dict(
+            intensity=ax.scatter(
+                [], [],
+                s=20,
+                marker='s',
+                facecolors='none',
+                edgecolors=[0, 0, 0, 0],
+                alpha=ALPHA['parallel'],
+            ),
+            intensity_mean=ax.scatter(
+                [], [],
+                s=40,
+                marker='s',
+                facecolors=COLOR['green'],
+                edgecolors=COLOR['green'],
+                alpha=.5,
+                label='recorded',
+            ),
+            intensity_linearized=ax.scatter(
+                [], [],
+                s=20,
+                marker='s',
+                facecolors='none',
+                edgecolors=[0, 0, 0, 0],
+                alpha=ALPHA['parallel'],
+            ),
+            intensity_linearized_mean=ax.scatter(
+                [], [],
+                s=40,
+                marker='s',
+                facecolors=COLOR['red'],
+                edgecolors=COLOR['red'],
+                alpha=.5,
+                label='recorded',
+            ),
+            intensity_true=ax.plot(
+                [], [],
+                color='black', linestyle=':',
+                alpha=.5,
+            )[0],
+            bounds=ax.axhspan(
+                1, 1,
                 alpha=.125, color=COLOR['red'],
-            )
+                visible=False,
+            ),
+        )
 
         ax.set_xscale('log')
         ax.set_yscale('log')
@@ -412,7 +681,7 @@ class RetriverViewWidget(BaseGraphWidget):
         ax.set_ylabel('$\log_{10}{R}$')
         ax.grid(True, color='grey', linestyle=':')
 
-        self.canvas.draw_idle()
+        return artists
 
     def _button_press_event(
         self,
@@ -430,6 +699,9 @@ class RetriverViewWidget(BaseGraphWidget):
             return None
 
         if event.button == 1:
+            if event.inaxes is None:
+                return None
+
             ax = self.figure.gca()
 
             self._selection_start = event.ydata
@@ -438,7 +710,7 @@ class RetriverViewWidget(BaseGraphWidget):
                 alpha=.125, color=COLOR['red'],
                 visible=True,
             )
-            self.canvas.draw_idle()
+            self.start_blit(self._selection)
 
     def _motion_notify_event(
         self,
@@ -447,21 +719,34 @@ class RetriverViewWidget(BaseGraphWidget):
         super()._motion_notify_event(event=event)
 
         if event.button == 1:
-            if self._selection_start is not None:
-                y_min = min(self._selection_start, event.ydata)
-                y_max = max(self._selection_start, event.ydata)
+            if (self._selection_start is not None) and (event.ydata is not None):
+                LATENCY.start(self, 'selection_band')
+                get_scheduler().schedule(self, 'selection', partial(self._update_selection, event))
 
-                self._selection.set_bounds(0, y_min, 1, y_max - y_min)
-                self.canvas.draw_idle()
+    def _update_selection(
+        self,
+        event: MouseEvent,
+    ) -> None:
+
+        if self._selection is None:
+            return None
+
+        y_min = min(self._selection_start, event.ydata)
+        y_max = max(self._selection_start, event.ydata)
+
+        self._selection.set_bounds(0, y_min, 1, y_max - y_min)
+        self.blit()
 
     def _button_release_event(
         self,
         event: MouseEvent,
     ) -> None:
+        get_scheduler().cancel(self)
 
         # update annotate
         if self._point_annotation:
-            self._point_annotation.set_visible(False)
+            self._point_annotation.remove()
+            self._point_annotation = None
             self.canvas.draw_idle()
 
         # update zoom and pan
@@ -480,6 +765,8 @@ class RetriverViewWidget(BaseGraphWidget):
             return None
 
         if event.button == 1:
+            if self._selection is not None:
+                self.stop_blit()
             self._selection_start = None
             self._selection = None
 
@@ -511,6 +798,7 @@ class RetriverViewWidget(BaseGraphWidget):
         # update zoom
         bounds = tuple(sorted([press_event.ydata, release_event.ydata]))
 
+        LATENCY.start(self, 'selection')
         self.parent().parent().parent().parent().update(
             column_id=self.column_id,
             bounds=bounds,
@@ -520,16 +808,18 @@ class RetriverViewWidget(BaseGraphWidget):
 class ResidualViewWidget(BaseGraphWidget):
 
     def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, size=QtCore.QSize(480, 480), **kwargs)
+        super().__init__(*args, size=GRAPH_SIZE, **kwargs)
 
     def _button_release_event(
         self,
         event: MouseEvent,
     ) -> None:
+        get_scheduler().cancel(self)
 
         # update annotate
         if self._point_annotation:
-            self._point_annotation.set_visible(False)
+            self._point_annotation.remove()
+            self._point_annotation = None
             self.canvas.draw_idle()
 
         # update zoom and pan
@@ -555,55 +845,92 @@ class ResidualViewWidget(BaseGraphWidget):
 
     def update(
         self,
-        frame: Frame,
+        aggregates: FrameAggregates,
     ) -> None:
-        super().update(frame=frame)
+        super().update(aggregates=aggregates)
 
-        ax = self.figure.gca()
-        ax.clear()
-
-        x = frame['concentration']
-        y = 100 * (frame['intensity'] - frame['intensity_true']) / frame['intensity_true']
-        ax.scatter(
-            x, y,
-            s=20,
-            marker='s',
-            facecolors='none',
-            edgecolors=[0, 0, 0, 0],
-            alpha=ALPHA['parallel'],
-        )
-        x = frame['concentration'].groupby(level=0, sort=False).mean()
-        y = 100 * (frame['intensity'].groupby(level=0, sort=False).mean() - frame['intensity_true'].groupby(level=0, sort=False).mean()) / frame['intensity_true'].groupby(level=0, sort=False).mean()
-        ax.scatter(
-            x, y,
-            s=40,
-            marker='s',
-            facecolors=COLOR['green'],
-            edgecolors=COLOR['green'],
-            alpha=.5,
-            label='recorded',
-        )
+        if self._artists is None:
+            self._artists = self._create_artists()
+
+        mean_residual = aggregates.mean_residual
+
+        x = aggregates.frame['concentration'].to_numpy()
+        x_mean = aggregates.mean['concentration'].to_numpy()
 
-        x = frame['concentration']
-        y = 100 * (frame['intensity_linearized'] - frame['intensity_true']) / frame['intensity_true']
-        ax.scatter(
-            x, y,
-            s=20,
-            marker='s',
-            facecolors='none',
-            edgecolors=[0, 0, 0, 0],
-            alpha=ALPHA['parallel'],
+        y = mean_residual['intensity'].to_numpy()
+        self._artists['intensity_mean'].set_offsets(np.column_stack([x_mean, y]))
+
+        y = mean_residual['intensity_linearized'].to_numpy()
+        self._artists['intensity_linearized_mean'].set_offsets(np.column_stack([x_mean, y]))
+
+        self.autoscale(
+            np.column_stack([x, np.zeros_like(x)]),
+            scaley=False,
         )
-        x = frame['concentration'].groupby(level=0, sort=False).mean()
-        y = 100 * (frame['intensity_linearized'].groupby(level=0, sort=False).mean() - frame['intensity_true'].groupby(level=0, sort=False).mean()) / frame['intensity_true'].groupby(level=0, sort=False).mean()
-        ax.scatter(
-            x, y,
-            s=40,
-            marker='s',
-            facecolors='red',
-            edgecolors='red',
-            alpha=.5,
-            label='recorded',
+        self.update_lod()
+        self.canvas.draw_idle()
+
+    def _hit_points(self) -> tuple[Array[float], Array[float], Sequence[Index]]:
+        mean, mean_residual = self.aggregates.mean, self.aggregates.mean_residual
+
+        x = np.tile(mean['concentration'].to_numpy(), 2)
+        y = np.concatenate([mean_residual['intensity'].to_numpy(), mean_residual['intensity_linearized'].to_numpy()])
+        labels = np.tile(mean.index.to_numpy(), 2)
+        return x, y, labels
+
+    def _parallels(self, summarized: bool = False) -> Mapping[str, Array[float]]:
+        if summarized:
+            summary = self.aggregates.residual_summary
+
+            return {
+                key: summary[['concentration', key]].to_numpy()
+                for key in ['intensity', 'intensity_linearized']
+            }
+
+        x = self.aggregates.frame['concentration'].to_numpy()
+        return {
+            key: np.column_stack([x, self.aggregates.residual[key].to_numpy()])
+            for key in ['intensity', 'intensity_linearized']
+        }
+
+    def _create_artists(self) -> Mapping[str, Artist]:
+        ax = self.figure.gca()
+
+        artists = dict(
+            intensity=ax.scatter(
+                [], [],
+                s=20,
+                marker='s',
+                facecolors='none',
+                edgecolors=[0, 0, 0, 0],
+                alpha=ALPHA['parallel'],
+            ),
+            intensity_mean=ax.scatter(
+                [], [],
+                s=40,
+                marker='s',
+                facecolors=COLOR['green'],
+                edgecolors=COLOR['green'],
+                alpha=.5,
+                label='recorded',
+            ),
+            intensity_linearized=ax.scatter(
+                [], [],
+                s=20,
+                marker='s',
+                facecolors='none',
+                edgecolors=[0, 0, 0, 0],
+                alpha=ALPHA['parallel'],
+            ),
+            intensity_linearized_mean=ax.scatter(
+                [], [],
+                s=40,
+                marker='s',
+                facecolors='red',
+                edgecolors='red',
+                alpha=.5,
+                label='recorded',
+            ),
         )
 
         ax.set_ylim([-100, +100])  # FIXME: add env
@@ -614,40 +941,263 @@ class ResidualViewWidget(BaseGraphWidget):
         ax.set_ylabel('Систематическая погрешность, $\%$')
         ax.grid(True, color='grey', linestyle=':')
 
-        self.canvas.draw_idle()
+        return artists
 
 
 class TabWidget(QtWidgets.QWidget):
+    """Tab of column. Graph widgets (and their canvases) are created on the first update."""
 
     def __init__(self, *args, column_id: str, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
+        self.column_id = column_id
+
+        self.retriver_view_widget = None
+        self.residual_view_widget = None
+
         layout = QtWidgets.QHBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
+        layout.setContentsMargins(*TAB_MARGINS)
+        layout.setSpacing(TAB_SPACING)
+
+    @property
+    def created(self) -> bool:
+        return self.retriver_view_widget is not None
+
+    def create(self) -> None:
+        if self.created:
+            return None
 
         self.retriver_view_widget = RetriverViewWidget(
-            column_id=column_id,
+            column_id=self.column_id,
         )
-        layout.addWidget(self.retriver_view_widget)
+        self.layout().addWidget(self.retriver_view_widget)
 
         self.residual_view_widget = ResidualViewWidget()
-        layout.addWidget(self.residual_view_widget)
+        self.layout().addWidget(self.residual_view_widget)
 
     def update(
         self,
         frame: Frame,
         bounds: tuple[R, R] | None,
     ) -> None:
+        self.create()
 
+        with LATENCY.measure('update.aggregates'):
+            aggregates = FrameAggregates.create(frame)
+
+        # widgets are drawn at idle time, so latencies are stopped by `draw_event`
+        LATENCY.start(self.retriver_view_widget, 'update.retriver')
         self.retriver_view_widget.update(
-            frame=frame,
+            aggregates=aggregates,
             bounds=bounds,
         )
+        LATENCY.start(self.residual_view_widget, 'update.residual')
         self.residual_view_widget.update(
-            frame=frame,
+            aggregates=aggregates,
+        )
+
+    def sizeHint(self) -> QtCore.QSize:  # noqa: N802
+        left, top, right, bottom = TAB_MARGINS
+
+        return QtCore.QSize(
+            left + 2 * GRAPH_SIZE.width() + TAB_SPACING + right,
+            top + GRAPH_SIZE.height() + bottom,
+        )
+
+
+class TransientViewWidget(BaseGraphWidget):
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, size=QtCore.QSize(965, 445), **kwargs)
+
+        self._cache = {}
+        self._pyramids = None
+        self._offsets = None
+        self._bad = None
+
+    def update(
+        self,
+        column_id: str,
+        frame: Frame,
+        bad: Frame | None = None,
+    ) -> None:
+        """Show transients of given `frame` and its `bad` points (envelopes' pyramids are built once per column)."""
+
+        if self._artists is None:
+            self._artists = self._create_artists()
+
+        if column_id not in self._cache:
+            self._cache[column_id] = [Pyramid.create(value) for value in frame['value']]
+        self._pyramids = self._cache[column_id]
+
+        # transients are placed one after another
+        sizes = np.array([len(pyramid) for pyramid in self._pyramids], dtype=int)
+        self._offsets = np.cumsum(sizes) - sizes
+
+        self._bad = np.empty((0, 2))
+        if bad is not None:
+            self._bad = np.column_stack([
+                np.concatenate([offset + index for offset, index in zip(self._offsets, bad['bad'])] or [[]]),
+                np.concatenate([*bad['value_bad'], []]),
+            ])
+
+        lower = [pyramid.lower[-1] for pyramid in self._pyramids if pyramid.n_levels > 0]
+        upper = [pyramid.upper[-1] for pyramid in self._pyramids if pyramid.n_levels > 0]
+        self.set_cropped_lims(lims=None)
+        self.autoscale(
+            np.array([
+                [0, np.nanmin(np.concatenate([*lower, [np.nan]]))],
+                [sizes.sum(), np.nanmax(np.concatenate([*upper, [np.nan]]))],
+            ]),
+        )
+        self.update_envelope()
+        self.canvas.draw_idle()
+
+    def update_zoom(self, lims: Lims | None = None) -> None:
+        super().update_zoom(lims=lims)
+
+        self.update_envelope()
+
+    def update_envelope(self) -> None:
+        """Update transients' envelopes to the level of resolution matching the current view."""
+
+        if self._pyramids is None:
+            return None
+
+        ax = self.canvas.axes
+        lb, ub = ax.get_xlim()
+
+        segments = []
+        for pyramid, offset in zip(self._pyramids, self._offsets):
+            if (offset > ub) or (offset + len(pyramid) < lb):
+                continue
+
+            level = pyramid.select_level(ub - lb, n_pixels=int(ax.bbox.width))
+            x, y = pyramid.query(lb - offset, ub - offset, level=level)
+            segments.append(np.column_stack([offset + x, y]))
+        self._artists['envelope'].set_segments(segments)
+
+        display = ax.transData.transform(self._bad)
+        index = decimate(display, index=find_visible(display, bounds=ax.bbox.bounds))
+        self._artists['bad'].set_offsets(self._bad[index])
+
+    def _hit_points(self) -> tuple[Array[float], Array[float], Sequence[Index]]:
+        return np.array([]), np.array([]), []
+
+    def _button_release_event(
+        self,
+        event: MouseEvent,
+    ) -> None:
+        get_scheduler().cancel(self)
+
+        # update annotate
+        if self._point_annotation:
+            self._point_annotation.remove()
+            self._point_annotation = None
+            self.canvas.draw_idle()
+
+        # update zoom and pan
+        if self.ctrl_modified and self.shift_modified:
+            return None
+
+        if self.ctrl_modified:
+            return None
+
+        if self.shift_modified:
+            if event.button == 1:
+                self._pan_event(
+                    self._mouse_event,
+                    event,
+                )
+            return None
+
+        if event.button == 3:
+            self._zoom_event(
+                self._mouse_event,
+                event,
+            )
+
+    def _create_artists(self) -> Mapping[str, Artist]:
+        ax = self.figure.gca()
+
+        artists = dict(
+            envelope=ax.add_collection(LineCollection(
+                [],
+                colors='black', linewidths=.5,
+                alpha=.5,
+            )),
+            bad=ax.scatter(
+                [], [],
+                s=10,
+                marker='x',
+                color=COLOR['red'],
+                label='bad',
+            ),
         )
 
+        ax.set_xlabel('Отсчет')
+        ax.set_ylabel('Интенсивность')
+        ax.grid(True, color='grey', linestyle=':')
+
+        return artists
+
+
+class TransientWidget(QtWidgets.QWidget):
+    """Transient viewer of selected column (rendered on show)."""
+
+    def __init__(self, *args, data: Mapping[str, AtomDatum], **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.column_id = None
+
+        self._data = data
+        self._rendered = None
+        self._bad = {}
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(5, 5, 5, 5)
+        layout.setSpacing(5)
+
+        self.combo_box = QtWidgets.QComboBox()
+        for column_id, datum in data.items():
+            self.combo_box.addItem(datum.nickname[::-1], column_id)
+        self.combo_box.currentIndexChanged.connect(self._render)
+        layout.addWidget(self.combo_box)
+
+        self.transient_view_widget = TransientViewWidget()
+        layout.addWidget(self.transient_view_widget)
+
+    def showEvent(self, event):  # noqa: N802
+        super().showEvent(event)
+
+        self._render()
+
+    def _render(self, *args) -> None:
+        column_id = self.combo_box.currentData()
+        if (column_id is None) or (column_id == self._rendered):
+            return None
+        self._rendered = column_id
+
+        if column_id not in self._bad:
+            self._bad[column_id] = self._parse_bad(column_id)
+
+        self.transient_view_widget.update(
+            column_id=column_id,
+            frame=self._data[column_id].frame,
+            bad=self._bad[column_id],
+        )
+
+    def _parse_bad(self, column_id: str) -> Frame | None:
+        datum = self._data[column_id]
+        if datum.filepath is None:
+            return None
+
+        try:
+            return parse_bad(datum.filepath, column_id)
+        except DataManagerError as error:
+            LOGGER.warning('Bad points of column %r are not shown: %r', column_id, error)
+            return None
+
 
 class ContentWidget(QtWidgets.QTabWidget):
 
@@ -718,6 +1268,32 @@ class PreviewWindow(QtWidgets.QWidget):
         )
         layout.addWidget(self.content_widget)
 
+        # overview
+        self.overview_widget = OverviewWidget(
+            column_ids=[
+                datum.column_id
+                for datum in data.values()
+            ],
+            nicknames=[
+                datum.nickname
+                for datum in data.values()
+            ],
+        )
+        self.overview_widget.activated.connect(self._activated)
+        self.content_widget.insertTab(0, self.overview_widget, 'Overview')
+        self.content_widget.setCurrentIndex(0)
+
+        # transients
+        self.transient_widget = TransientWidget(
+            data=data,
+        )
+        self.content_widget.addTab(self.transient_widget, 'Transients')
+
+        # lazy rendering
+        self._pending = {}
+        self._prefetch_scheduled = False
+        self.content_widget.currentChanged.connect(self._current_changed)
+
         # geometry
         self.setFixedSize(self.sizeHint())
 
@@ -736,13 +1312,81 @@ class PreviewWindow(QtWidgets.QWidget):
             bounds=bounds,
         )
 
+        # render thumbnail off the UI thread
+        self.overview_widget.update(
+            column_id=column_id,
+            frame=frame,
+            bounds=bounds,
+        )
+
+        # render current tab only (other tabs are rendered on activation or prefetched)
+        self._pending[column_id] = (frame, bounds)
+
         widget = find_tab(self.content_widget, text=datum.nickname[::-1])
+        if widget is self.content_widget.currentWidget():
+            self._render(column_id)
+
+        # prefetch when all updates are queued (at the first idle time)
+        if not self._prefetch_scheduled:
+            self._prefetch_scheduled = True
+            QtCore.QTimer.singleShot(0, self._prefetch_current)
+
+    def _render(
+        self,
+        column_id: str,
+    ) -> None:
+        if column_id not in self._pending:
+            return None
+
+        frame, bounds = self._pending.pop(column_id)
+
+        widget = find_tab(self.content_widget, text=self._data[column_id].nickname[::-1])
         widget.update(
             frame=frame,
             bounds=bounds,
         )
 
+    def _prefetch_current(self) -> None:
+        self._prefetch_scheduled = False
+        self._prefetch(self.content_widget.currentIndex())
+
+    def _prefetch(
+        self,
+        index: int,
+    ) -> None:
+        """Render neighbouring tabs of given `index` at idle time."""
+
+        for i in (index + 1, index - 1):
+            widget = self.content_widget.widget(i)
+            if isinstance(widget, TabWidget) and (widget.column_id in self._pending):
+                QtCore.QTimer.singleShot(0, partial(self._render, widget.column_id))
+
+    def _current_changed(
+        self,
+        index: int,
+    ) -> None:
+        widget = self.content_widget.widget(index)
+        if not isinstance(widget, TabWidget):
+            return None
+
+        if widget.column_id in self._pending:
+            with LATENCY.measure('tab.create'):
+                widget.create()
+            LATENCY.start(widget.retriver_view_widget, 'tab')
+        self._render(widget.column_id)
+        self._prefetch(index)
+
+    def _activated(
+        self,
+        column_id: str,
+    ) -> None:
+        widget = find_tab(self.content_widget, text=self._data[column_id].nickname[::-1])
+        self.content_widget.setCurrentWidget(widget)
+
     def closeEvent(self, event):  # noqa: N802
+        LOGGER.debug('Redraw scheduler: %s', get_scheduler().stats())
+        LATENCY.dump(PLUGIN_CONFIG.latency_filepath or None)
+        self.overview_widget.renderer.shutdown()
 
         self.setParent(None)
         event.accept()
@@ -0,0 +1,87 @@
+from collections.abc import Sequence
+from typing import Self
+
+import numpy as np
+
+from spectrumlab.types import Array
+
+
+DEFAULT_FACTOR = 4
+
+
+class Pyramid:
+    """Multi-resolution min/max envelope of transient (each level is `factor` times coarser than previous one)."""
+
+    def __init__(
+        self,
+        lower: Sequence[Array[float]],
+        upper: Sequence[Array[float]],
+        factor: int,
+    ) -> None:
+        self.lower = lower
+        self.upper = upper
+        self.factor = factor
+
+    @property
+    def n_levels(self) -> int:
+        return len(self.lower)
+
+    def select_level(
+        self,
+        span: float,
+        n_pixels: int,
+    ) -> int:
+        """Select the coarsest level with at least one bin per pixel within `span` (in samples)."""
+
+        ratio = max(span / max(n_pixels, 1), 1)
+        level = int(np.floor(np.log(ratio) / np.log(self.factor)))
+        return min(level, self.n_levels - 1)
+
+    def query(
+        self,
+        lb: float,
+        ub: float,
+        level: int,
+    ) -> tuple[Array[float], Array[float]]:
+        """Get envelope's polyline (min and max of each bin) within [`lb`, `ub`] samples at given `level`."""
+
+        step = self.factor**level
+        lower, upper = self.lower[level], self.upper[level]
+
+        i0 = max(int(np.floor(lb / step)), 0)
+        i1 = min(int(np.ceil(ub / step)) + 1, len(lower))
+        if i0 >= i1:
+            return np.array([]), np.array([])
+
+        x = np.arange(i0, i1) * step + (step - 1) / 2
+        if level == 0:
+            return x, lower[i0:i1]
+        return np.repeat(x, 2), np.column_stack([lower[i0:i1], upper[i0:i1]]).ravel()
+
+    def __len__(self) -> int:
+        return len(self.lower[0])
+
+    @classmethod
+    def create(
+        cls,
+        values: Array[float],
+        factor: int = DEFAULT_FACTOR,
+    ) -> Self:
+        values = np.asarray(values, dtype=float)
+
+        lower, upper = [values], [values]
+        while len(lower[-1]) > 1:
+            size = -(-len(lower[-1]) // factor) * factor
+
+            lower.append(np.fmin.reduce(pad(lower[-1], size).reshape(-1, factor), axis=1))
+            upper.append(np.fmax.reduce(pad(upper[-1], size).reshape(-1, factor), axis=1))
+
+        return cls(
+            lower=lower,
+            upper=upper,
+            factor=factor,
+        )
+
+
+def pad(values: Array[float], size: int) -> Array[float]:
+    return np.pad(values, (0, size - len(values)), constant_values=np.nan)
@@ -0,0 +1,169 @@
+import json
+import os
+import time
+from base64 import b64encode
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+from xml.etree.ElementTree import Element, SubElement, tostring
+
+import numpy as np
+import pytest
+
+
+BASELINES_FILEPATH = Path(__file__).parent / 'baselines.json'
+THRESHOLD = float(os.environ.get('BENCHMARK_THRESHOLD', 1.25))  # allowed ratio to baseline
+SAVE = os.environ.get('BENCHMARK_SAVE', '0') not in ('', '0')
+DEFAULT_REPEAT = 5
+
+
+@dataclass(frozen=True)
+class TableConfig:
+    n_columns: int
+    n_probes: int
+    n_parallels: int
+    n_samples: int
+    bad_ratio: float = .01
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        return '{}x{}x{}x{}-bad{:g}'.format(
+            self.n_columns, self.n_probes, self.n_parallels, self.n_samples, self.bad_ratio,
+        )
+
+
+BASE_TABLE_CONFIG = TableConfig(n_columns=4, n_probes=20, n_parallels=3, n_samples=2048)
+TABLE_CONFIGS = (  # each dimension is varied over the base one
+    BASE_TABLE_CONFIG,
+    replace(BASE_TABLE_CONFIG, n_columns=16),
+    replace(BASE_TABLE_CONFIG, n_probes=80),
+    replace(BASE_TABLE_CONFIG, n_parallels=10),
+    replace(BASE_TABLE_CONFIG, n_samples=8192),
+    replace(BASE_TABLE_CONFIG, bad_ratio=0),
+    replace(BASE_TABLE_CONFIG, bad_ratio=.1),
+)
+
+
+def create_table_xml(config: TableConfig) -> str:
+    """Create synthetic Atom's table with `config.n_columns` lines of saturated absorption transients."""
+
+    rng = np.random.default_rng(config.seed)
+
+    root = Element('root')
+
+    __titul = SubElement(root, 'titul')
+    for tag in ('organization', 'device', 'user', 'aname'):
+        SubElement(__titul, tag).text = 'Benchmark'
+
+    # columns
+    concentrations = np.logspace(-3, 1, config.n_probes)
+    column_ids = [str(100 + i) for i in range(config.n_columns)]
+
+    __sheet = SubElement(SubElement(root, 'columns'), 'sheet')
+    for i, column_id in enumerate(column_ids):
+        name = 'El {:.3f}'.format(200 + i)
+        __column = SubElement(__sheet, 'column', id=column_id, name=name, type='line', visible='yes')
+
+        __cells = SubElement(__column, 'cells')
+        for probe, concentration in enumerate(concentrations):
+            SubElement(__cells, 'pc', i=str(probe), cm=str(concentration))
+
+    # probes
+    t = np.linspace(0, 1, config.n_samples)
+    shape = np.exp(-(t - .4)**2 / (2 * .1**2))
+
+    __probes = SubElement(root, 'probes')
+    for probe, concentration in enumerate(concentrations):
+        __probe = SubElement(__probes, 'probe', id=str(probe), name='Sample{}'.format(probe), visible='yes')
+
+        for parallel in range(config.n_parallels):
+            __spe = SubElement(__probe, 'spe', name='parallel{}'.format(parallel), disabled='no')
+            __graphs = SubElement(__spe, 'graphs')
+
+            for i, column_id in enumerate(column_ids):
+                absorbance = (1 + i) * concentration * shape
+                value = 1000 * (1 - np.exp(-absorbance)) * (1 + .01 * rng.normal(size=config.n_samples))
+
+                __graph = SubElement(__graphs, 'graph', id=column_id)
+                __yvals = SubElement(__graph, 'yvals', value_array_size=str(config.n_samples))
+                __yvals.text = b64encode(value.astype(np.float32).tobytes()).decode('ascii')
+
+                n_bad = int(config.bad_ratio * config.n_samples)
+                if n_bad > 0:
+                    bad = np.sort(rng.choice(config.n_samples, size=n_bad, replace=False)).astype(np.int32)
+                    SubElement(__graph, 'bad').text = b64encode(bad.tobytes()).decode('ascii')
+
+    return tostring(root, encoding='unicode')
+
+
+class Benchmark:
+    """Time callable (the best of `repeat` runs) and compare with saved baseline."""
+
+    def __init__(self, name: str, baselines: dict[str, float]) -> None:
+        self.name = name
+        self.baselines = baselines
+
+        self.elapsed = None
+
+    def __call__(self, func: Callable, *args, repeat: int = DEFAULT_REPEAT, **kwargs) -> Any:
+
+        timings = []
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append(time.perf_counter() - started_at)
+        self.elapsed = min(timings)
+
+        if SAVE:
+            self.baselines[self.name] = self.elapsed
+            return result
+
+        baseline = self.baselines[self.name]
+        assert self.elapsed <= THRESHOLD * baseline, '{}: {:.4f} s, baseline: {:.4f} s'.format(
+            self.name, self.elapsed, baseline,
+        )
+        return result
+
+
+@pytest.fixture(scope='session')
+def baselines() -> Mapping[str, float]:
+    baselines = json.loads(BASELINES_FILEPATH.read_text()) if BASELINES_FILEPATH.exists() else {}
+
+    yield baselines
+
+    if SAVE:
+        BASELINES_FILEPATH.write_text(json.dumps(baselines, indent=2, sort_keys=True) + '\n')
+
+
+@pytest.fixture
+def benchmark(
+    request,
+    baselines: dict[str, float],
+) -> Benchmark:
+    if not SAVE and request.node.name not in baselines:  # baselines depend on machine
+        pytest.skip('{}: baseline is missing, save it by `{}`'.format(
+            request.node.name, 'BENCHMARK_SAVE=1 pytest tests/benchmarks',
+        ))
+
+    return Benchmark(
+        name=request.node.name,
+        baselines=baselines,
+    )
+
+
+@pytest.fixture(scope='module', params=TABLE_CONFIGS, ids=lambda config: config.name)
+def table_config(request) -> TableConfig:
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def table_filepath(
+    table_config: TableConfig,
+    tmp_path_factory,
+) -> Path:
+    filepath = tmp_path_factory.mktemp('benchmarks') / 'py_table.xml'
+    filepath.write_text(create_table_xml(table_config), encoding='utf-8')
+
+    return filepath
@@ -0,0 +1,96 @@
+import os
+import tracemalloc
+
+import pytest
+
+from plugin.config import PLUGIN_CONFIG
+from plugin.diagnostics import MemoryProfiler
+from plugin.managers.correction_manager import CorrectionManager
+from plugin.managers.correction_manager.core import process_data
+from plugin.managers.data_manager.parsers import AtomDataParser, FilepathParser
+from plugin.managers.report_manager import ReportManager
+
+
+MEMORY_BUDGET = float(os.environ.get('BENCHMARK_MEMORY_BUDGET', 16))  # allowed peak memory per MB of input
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope='module')
+def atom_data(table_filepath):
+    return AtomDataParser.parse(str(table_filepath))
+
+
+@pytest.fixture(scope='module')
+def correction_manager(atom_data):
+    correction_manager = CorrectionManager(PLUGIN_CONFIG)
+    for column_id, datum in atom_data.data.items():
+        correction_manager.update(column_id, datum.frame, bounds=None)
+
+    return correction_manager
+
+
+def test_parse_filepath(benchmark, table_filepath):
+    xml = '<input>{}</input>'.format(table_filepath)
+
+    assert benchmark(FilepathParser.parse, xml) == str(table_filepath)
+
+
+def test_parse_data(benchmark, table_config, table_filepath):
+    atom_data = benchmark(AtomDataParser.parse, str(table_filepath))
+
+    assert len(atom_data.data) == table_config.n_columns
+
+
+def test_update(benchmark, atom_data):
+    column_id, datum = next(iter(atom_data.data.items()))
+
+    bounds, data = benchmark(CorrectionManager(PLUGIN_CONFIG).update, column_id, datum.frame, bounds=None)
+
+    assert len(data) > 0
+
+
+def test_process_data(benchmark, atom_data, correction_manager):
+    column_id, datum = next(iter(atom_data.data.items()))
+
+    data = benchmark(process_data, datum.frame, transformer=correction_manager.transformer[column_id])
+
+    assert len(data) > 0
+
+
+def test_build_report(benchmark, atom_data, correction_manager):
+    report = benchmark(
+        ReportManager(PLUGIN_CONFIG).build,
+        data=atom_data.data,
+        transformers=correction_manager.transformer,
+        aggregated=correction_manager.aggregated,
+    )
+
+    assert report
+
+
+def test_memory(table_filepath):
+    profiler = MemoryProfiler(enabled=True)
+    try:
+        with profiler.measure('parse'):
+            atom_data = AtomDataParser.parse(str(table_filepath))
+
+        correction_manager = CorrectionManager(PLUGIN_CONFIG)
+        for column_id, datum in atom_data.data.items():
+            with profiler.measure('update', column_id=column_id):
+                correction_manager.update(column_id, datum.frame, bounds=None)
+
+        with profiler.measure('build'):
+            ReportManager(PLUGIN_CONFIG).build(
+                data=atom_data.data,
+                transformers=correction_manager.transformer,
+                aggregated=correction_manager.aggregated,
+            )
+    finally:
+        tracemalloc.stop()  # do not slow down other benchmarks
+
+    size = table_filepath.stat().st_size
+    for record in profiler.records:
+        assert record.peak / size <= MEMORY_BUDGET, '{}: {:.1f} MB per MB of input'.format(
+            record.name, record.peak / size,
+        )
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plugin.presentation.windows.aggregates import FrameAggregates, calculate_residual
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            'concentration': [1, 1, 10, 10],
+            'intensity': [90, 110, 500, 700],
+            'intensity_true': [100, 100, 1000, 1000],
+            'intensity_linearized': [99, 103, 980, 1000],
+            'value': [np.zeros(3)] * 4,  # is dropped
+        },
+        index=pd.MultiIndex.from_tuples(
+            [('Sample1', 'p1'), ('Sample1', 'p2'), ('Sample0', 'p1'), ('Sample0', 'p2')],
+            names=['probe_name', 'parallel_name'],
+        ),
+    )
+
+
+def test_calculate_residual(frame):
+    residual = calculate_residual(frame)
+
+    assert list(residual.columns) == ['intensity', 'intensity_linearized']
+    assert residual.index.equals(frame.index)
+    assert residual['intensity'].tolist() == pytest.approx([-10, 10, -50, -30])
+    assert residual['intensity_linearized'].tolist() == pytest.approx([-1, 3, -2, 0])
+
+
+def test_frame_aggregates(frame):
+    aggregates = FrameAggregates.create(frame)
+
+    assert list(aggregates.frame.columns) == ['concentration', 'intensity', 'intensity_true', 'intensity_linearized']
+
+    # probes are kept in order of the frame
+    assert aggregates.mean.index.tolist() == ['Sample1', 'Sample0']
+    assert aggregates.mean['intensity'].tolist() == pytest.approx([100, 600])
+    assert aggregates.mean['intensity_linearized'].tolist() == pytest.approx([101, 990])
+
+    assert aggregates.residual.equals(calculate_residual(aggregates.frame))
+    assert aggregates.mean_residual['intensity'].tolist() == pytest.approx([0, -40])
+    assert aggregates.mean_residual['intensity_linearized'].tolist() == pytest.approx([1, -1])
+
+
+def test_frame_aggregates_summary(frame):
+    aggregates = FrameAggregates.create(frame)
+
+    summary = aggregates.summary
+    assert summary.loc[('Sample0', 0), 'intensity'] == 500
+    assert summary.loc[('Sample0', 1), 'intensity'] == 700
+    assert summary.loc[('Sample1', .5), 'intensity'] == 100
+    assert aggregates.summary is summary  # computed once
+
+    residual_summary = aggregates.residual_summary
+    assert residual_summary.loc[('Sample0', 0), 'intensity'] == pytest.approx(-50)
+    assert residual_summary.loc[('Sample0', 1), 'concentration'] == 10
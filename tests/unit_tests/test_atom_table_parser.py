@@ -0,0 +1,81 @@
+from base64 import b64encode
+from xml.etree.ElementTree import Element, SubElement
+
+import numpy as np
+import pytest
+
+from plugin.config import PLUGIN_CONFIG
+from plugin.managers.data_manager.parsers.atom_table_parser import AtomTableParser
+from plugin.types import XML
+
+
+VALUES = {
+    ('0', 'parallel0'): [1, 2, 10, 3],
+    ('0', 'parallel1'): [2, 3, 4, 5],
+    ('1', 'parallel0'): [5, 20, 7, 8],
+}
+BAD = {
+    ('0', 'parallel0'): [2],
+    ('1', 'parallel0'): [1, 3],
+}
+
+
+@pytest.fixture(scope='module')
+def xml() -> XML:
+    root = Element('root')
+
+    __sheet = SubElement(SubElement(root, 'columns'), 'sheet')
+    __column = SubElement(__sheet, 'column', id='100', name='El 200.000', type='line', visible='yes')
+    __cells = SubElement(__column, 'cells')
+    for probe_id in ('0', '1'):
+        SubElement(__cells, 'pc', i=probe_id, cm='1')
+
+    __probes = SubElement(root, 'probes')
+    for probe_id in ('0', '1'):
+        __probe = SubElement(__probes, 'probe', id=probe_id, name='Sample{}'.format(probe_id), visible='yes')
+
+        for parallel_name in ('parallel0', 'parallel1'):
+            key = (probe_id, parallel_name)
+            if key not in VALUES:
+                continue
+
+            __graphs = SubElement(SubElement(__probe, 'spe', name=parallel_name, disabled='no'), 'graphs')
+            __graph = SubElement(__graphs, 'graph', id='100')
+
+            value = np.array(VALUES[key], dtype=np.float32)
+            __yvals = SubElement(__graph, 'yvals', value_array_size=str(len(value)))
+            __yvals.text = b64encode(value.tobytes()).decode('ascii')
+            if key in BAD:
+                bad = np.array(BAD[key], dtype=np.int32)
+                SubElement(__graph, 'bad').text = b64encode(bad.tobytes()).decode('ascii')
+
+    return root
+
+
+def test_mask_bad(xml):
+    """Bad points are masked (the `bad` element has no children, so it is falsy)."""
+
+    frame = AtomTableParser.from_xml(xml)['100'].frame
+
+    assert frame['intensity'].tolist() == [3, 5, 7]
+    assert np.isnan(frame['value'].iloc[0][2])
+    assert np.isnan(frame['value'].iloc[2][[1, 3]]).all()
+    assert not np.isnan(frame['value'].iloc[1]).any()
+
+
+def test_parse_bad(xml):
+    assert PLUGIN_CONFIG.black_name not in ('Sample0', 'Sample1')
+
+    frame = AtomTableParser.from_xml(xml)['100'].frame
+    bad = AtomTableParser.parse_bad(xml, column_id='100')
+
+    assert 'bad' not in frame.columns
+    assert bad.index.equals(frame.index)
+    assert [index.tolist() for index in bad['bad']] == [[2], [], [1, 3]]
+    assert [value.tolist() for value in bad['value_bad']] == [[10], [], [20, 8]]
+
+
+def test_parse_bad_unknown_column(xml):
+    bad = AtomTableParser.parse_bad(xml, column_id='101')
+
+    assert bad.empty
@@ -0,0 +1,62 @@
+import xml.etree.ElementTree as ElementTree
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plugin.dto import AtomDatum
+from plugin.managers.data_manager.parsers.atom_table_parser import parse_plugin
+from plugin.managers.report_manager.report_manager import is_changed
+from plugin.managers.report_manager.writer import write_report
+
+
+def create_datum(bounds=None, polynom=None) -> AtomDatum:
+    return AtomDatum(
+        column_id='1',
+        nickname='Ag 338.289',
+        frame=pd.DataFrame(),
+        bounds=bounds,
+        polynom=polynom,
+    )
+
+
+BOUNDS = (.01, .1)
+POLYNOM = (np.array([1., 2., 3.]), np.array([1., 4., np.nan]))
+
+
+@pytest.mark.parametrize(['datum', 'expected'], [
+    (create_datum(), True),
+    (create_datum(bounds=BOUNDS), True),
+    (create_datum(bounds=BOUNDS, polynom=list(zip(*POLYNOM))), False),
+    (create_datum(bounds=(.01, .1 + 1e-9), polynom=list(zip(*POLYNOM))), False),
+    (create_datum(bounds=(.01, .2), polynom=list(zip(*POLYNOM))), True),
+    (create_datum(bounds=BOUNDS, polynom=list(zip(*POLYNOM))[:2]), True),
+    (create_datum(bounds=BOUNDS, polynom=[(1., 1.), (2., 4.1), (3., np.nan)]), True),
+])
+def test_is_changed(datum, expected):
+    assert is_changed(datum, bounds=BOUNDS, polynom=POLYNOM) == expected
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_unchanged_round_trip(compact):
+    columns = [
+        dict(id='1', nickname='Ag 338.289', bounds={'lb': str(BOUNDS[0]), 'ub': str(BOUNDS[1])}, polynom=POLYNOM),
+        dict(id='2', nickname='Cu 324.754', unchanged=True),
+    ]
+
+    buffer = StringIO()
+    write_report(buffer, columns=columns, compact=compact)
+
+    # report is echoed back by Atom in plugin's section of table
+    __plugin = ElementTree.fromstring(buffer.getvalue())
+    __plugin.tag = 'plugin-absorption-correction'
+    bounds, polynom = parse_plugin(__plugin)
+
+    assert bounds == {'1': BOUNDS}
+    assert set(polynom) == {'1'}
+    assert np.array_equal(np.array(polynom['1']).T, np.stack(POLYNOM), equal_nan=True)
+
+    # unchanged column is recalculated and written in full
+    assert is_changed(create_datum(bounds=bounds.get('2'), polynom=polynom.get('2')), bounds=BOUNDS, polynom=POLYNOM)
+    assert not is_changed(create_datum(bounds=bounds['1'], polynom=polynom['1']), bounds=BOUNDS, polynom=POLYNOM)
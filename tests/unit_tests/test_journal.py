@@ -0,0 +1,50 @@
+from plugin.diagnostics.journal import aggregate_records, read_records, write_record
+
+
+def test_journal(tmp_path):
+    filepath = str(tmp_path / 'metrics.jsonl')
+
+    for i in range(1, 101):
+        write_record(
+            {'version': '1.0' if i <= 50 else '1.1', 'durations': {'run': i / 100, 'fit': i / 1000}, 'peak_rss': None},
+            filepath=filepath,
+            max_size=2**20,
+        )
+
+    records = read_records(filepath)
+    assert len(records) == 100
+
+    aggregated = aggregate_records(records)
+    assert set(aggregated['all']) == {'run', 'fit'}
+    assert aggregated['all']['run']['n'] == 100
+    assert aggregated['all']['run']['p50'] == .5
+    assert aggregated['all']['run']['p99'] == .99
+
+    aggregated = aggregate_records(records, by='version')
+    assert aggregated['1.0']['run']['p50'] == .25
+    assert aggregated['1.1']['run']['p50'] == .75
+
+
+def test_journal_rotation(tmp_path):
+    filepath = str(tmp_path / 'metrics.jsonl')
+
+    for i in range(100):
+        write_record({'durations': {'run': i}}, filepath=filepath, max_size=1024)
+
+    assert (tmp_path / 'metrics.jsonl').stat().st_size <= 1024
+    assert (tmp_path / 'metrics.jsonl.1').stat().st_size <= 1024
+
+    records = read_records(filepath)
+    assert 0 < len(records) < 100
+    assert records[-1]['durations']['run'] == 99
+
+
+def test_journal_rotation_in_bytes(tmp_path):
+    filepath = str(tmp_path / 'metrics.jsonl')
+
+    for i in range(100):
+        write_record({'version': 'версия', 'durations': {'run': i}}, filepath=filepath, max_size=1024)
+
+    assert (tmp_path / 'metrics.jsonl').stat().st_size <= 1024
+    assert (tmp_path / 'metrics.jsonl.1').stat().st_size <= 1024
+    assert read_records(filepath)[-1]['version'] == 'версия'
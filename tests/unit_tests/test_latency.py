@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from plugin.diagnostics.latency import LatencyHistogram, LatencyRecorder
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    for i in range(1, 101):
+        histogram.add(i / 1000)
+
+    assert histogram.n == 100
+    assert histogram.percentile(50) == pytest.approx(.05, rel=.15)
+    assert histogram.percentile(99) <= histogram.max == .1
+    assert histogram.percentile(50) <= histogram.percentile(90) <= histogram.percentile(99)
+
+
+def test_latency_recorder(tmp_path):
+    recorder = LatencyRecorder(enabled=True)
+
+    recorder.start('owner', 'pan')
+    recorder.start('owner', 'pan')
+    recorder.stop('owner')
+    recorder.stop('owner')
+    with recorder.measure('fit'):
+        pass
+
+    assert recorder.histograms['pan'].n == 1
+    assert recorder.histograms['fit'].n == 1
+
+    filepath = tmp_path / 'latency.json'
+    recorder.dump(filepath)
+    assert set(json.loads(filepath.read_text())) == {'fit', 'pan'}
+
+
+def test_disabled_latency_recorder():
+    recorder = LatencyRecorder(enabled=False)
+
+    recorder.start('owner', 'pan')
+    recorder.stop('owner')
+    with recorder.measure('fit'):
+        pass
+
+    assert recorder.histograms == {}
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plugin.managers.correction_manager.core import linearize_transients
+
+
+class Transformer:
+
+    def __init__(self) -> None:
+        self.sizes = []
+
+    def apply(self, values):
+        values = np.asarray(values, dtype=float)
+        self.sizes.append(len(values))
+
+        return values * (1 + .3*values + 1e-9)
+
+
+def create_frame(sizes, dtype=np.float32) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+
+    return pd.DataFrame(
+        {'value': [rng.uniform(0, 10, size).astype(dtype) for size in sizes]},
+        index=pd.MultiIndex.from_tuples(
+            [('probe', str(i)) for i in range(len(sizes))],
+            names=['probe_name', 'parallel_name'],
+        ),
+    )
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 10, 25, 1000])
+def test_linearize_transients(chunk_size):
+    frame = create_frame([10, 3, 0, 12, 10, 5])
+
+    transformer = Transformer()
+    linearized = linearize_transients(frame, transformer=transformer, chunk_size=chunk_size)
+    expected = linearize_transients(frame, transformer=Transformer(), chunk_size=2**20)
+
+    assert linearized.index.equals(frame.index)
+    assert max(transformer.sizes) <= chunk_size
+    for value, item, expected_item in zip(frame['value'], linearized, expected):
+        assert len(item) == len(value)
+        assert item.dtype == np.float64
+        assert np.array_equal(item, expected_item)
+        assert np.array_equal(item, Transformer().apply(value))
+
+
+def test_linearize_empty_transients():
+    frame = create_frame([])
+
+    linearized = linearize_transients(frame, transformer=Transformer(), chunk_size=10)
+
+    assert len(linearized) == 0
+
+
+def test_linearize_transients_by_chunks():
+    """Transformer is applied to chunks spanning rows (not to each row)."""
+
+    frame = create_frame([3, 4, 5, 6, 7])
+
+    transformer = Transformer()
+    linearize_transients(frame, transformer=transformer, chunk_size=10)
+
+    assert transformer.sizes == [10, 10, 5]
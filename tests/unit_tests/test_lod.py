@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from plugin.presentation.windows.lod import decimate, find_visible
+
+
+@pytest.fixture
+def xy() -> np.ndarray:
+    rng = np.random.default_rng(0)
+
+    x = np.repeat(np.arange(100), 100) + rng.uniform(0, 1, size=100*100)
+    y = 50 + 20*rng.normal(size=100*100)
+    return np.column_stack([x, y])
+
+
+def test_find_visible_edges():
+    xy = np.array([
+        (0, 0), (10, 0), (0, 10), (10, 10),  # on edges
+        (-1e-9, 5), (5, 10 + 1e-9),  # outside
+        (5, 5), (np.nan, 5),
+    ])
+
+    index = find_visible(xy, bounds=(0, 0, 10, 10))
+    assert index.tolist() == [0, 1, 2, 3, 6]
+
+
+def test_find_visible_empty():
+    index = find_visible(np.empty((0, 2)), bounds=(0, 0, 10, 10))
+
+    assert len(index) == 0
+
+
+@pytest.mark.parametrize('cell_size', [.5, 2, 10])
+def test_decimate(
+    xy: np.ndarray,
+    cell_size: float,
+):
+    index = find_visible(xy, bounds=(0, 0, 100, 100))
+    decimated = decimate(xy, index=index, cell_size=cell_size)
+
+    assert len(decimated) <= len(index)
+    assert np.all(np.isin(decimated, index))
+    assert np.all(np.diff(decimated) > 0)
+
+    # every occupied cell is kept
+    cells = {tuple(cell) for cell in np.floor(xy[index] / cell_size).astype(int).tolist()}
+    assert {tuple(cell) for cell in np.floor(xy[decimated] / cell_size).astype(int).tolist()} == cells
+
+
+@pytest.mark.parametrize('cell_size', [2, 10])
+def test_decimate_extremes(
+    xy: np.ndarray,
+    cell_size: float,
+):
+    index = np.arange(len(xy))
+    decimated = decimate(xy, index=index, cell_size=cell_size)
+
+    assert len(decimated) < len(index)
+    assert np.argmin(xy[:, 1]) in decimated
+    assert np.argmax(xy[:, 1]) in decimated
+
+    # extremes of each column
+    columns = np.floor(xy[:, 0] / cell_size)
+    for column in np.unique(columns):
+        mask = columns == column
+        assert np.max(xy[decimated[mask[decimated]], 1]) == np.max(xy[mask, 1])
+        assert np.min(xy[decimated[mask[decimated]], 1]) == np.min(xy[mask, 1])
+
+
+def test_decimate_empty():
+    index = decimate(np.empty((0, 2)), index=np.array([], dtype=int))
+
+    assert len(index) == 0
@@ -0,0 +1,30 @@
+import logging
+import queue
+
+from plugin.loggers import BlockingQueueListener, CompressedRotatingFileHandler, DroppingQueueHandler
+
+
+def test_log_at_exit(tmp_path):
+    file_handler = CompressedRotatingFileHandler(str(tmp_path / '.log'), max_bytes=0, backup_count=0)
+    handler = DroppingQueueHandler(queue.Queue(maxsize=10))
+    handler.listener = BlockingQueueListener(handler.queue, file_handler, respect_handler_level=True)
+    handler.listener.start()
+
+    logger = logging.getLogger('test-log-at-exit')
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    def hook() -> None:  # `atexit` hook registered before the listener's stop one
+        logger.info('at exit')
+
+    try:
+        logger.info('at run')
+        handler.listener.stop()
+        hook()
+    finally:
+        logger.removeHandler(handler)
+        file_handler.close()
+
+    lines = (tmp_path / '.log').read_text().splitlines()
+    assert lines == ['at run', 'at exit']
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from plugin.managers.correction_manager.exceptions import LookupTableError
+from plugin.managers.correction_manager.lookup_table import compile_transformer
+
+
+class Transformer:
+
+    bounds = (.01, .1)
+
+    def __init__(self, sign: float = 1) -> None:
+        self.sign = sign
+
+    def apply(self, values):
+        values = np.asarray(values, dtype=float)
+        return self.sign * values * (1 + .3*values + .05*values**2)
+
+
+@pytest.mark.parametrize('tolerance', [1e-3, 1e-6])
+def test_compile_transformer(
+    tolerance: float,
+):
+    transformer = Transformer()
+
+    lookup_table = compile_transformer(
+        transformer,
+        domain=(0, 20),
+        tolerance=tolerance,
+    )
+    assert lookup_table.error <= tolerance
+    assert lookup_table.bounds == transformer.bounds
+
+    x = np.linspace(0, 20, 10001)
+    y = transformer.apply(x)
+    assert np.allclose(lookup_table.apply(x), y, rtol=10*tolerance, atol=tolerance)
+
+
+def test_apply_out_of_domain():
+    transformer = Transformer()
+
+    lookup_table = compile_transformer(
+        transformer,
+        domain=(0, 20),
+        tolerance=1e-6,
+    )
+
+    x = np.array([[-1, 10], [25, np.nan]])
+    y = lookup_table.apply(x)
+    assert y.shape == x.shape
+    assert y[0, 0] == transformer.apply(-1)
+    assert y[1, 0] == transformer.apply(25)
+    assert np.isnan(y[1, 1])
+    assert lookup_table(10.) == y[0, 1]
+
+
+def test_compile_not_monotone_transformer():
+
+    with pytest.raises(LookupTableError):
+        compile_transformer(
+            Transformer(sign=-1),
+            domain=(0, 20),
+            tolerance=1e-6,
+        )
@@ -0,0 +1,31 @@
+from plugin.diagnostics.memory import MB, MemoryProfiler
+
+
+def test_memory_profiler():
+    profiler = MemoryProfiler(enabled=True)
+
+    with profiler.measure('run'):
+        with profiler.measure('parse', n_bytes=10):
+            buffer = bytearray(8 * MB)
+            del buffer
+        with profiler.measure('update', column_id='1'):
+            retained = bytearray(2 * MB)
+
+    records = {record.name: record for record in profiler.records}
+    assert set(records) == {'run', 'parse', 'update'}
+    assert 8 * MB <= records['parse'].peak < 9 * MB
+    assert records['parse'].delta < MB
+    assert MB < records['update'].delta < 3 * MB
+    assert records['update'].top
+    assert records['run'].peak >= records['parse'].peak
+    assert records['parse'].attributes == {'n_bytes': 10}
+    assert len(retained) == 2 * MB
+
+
+def test_disabled_memory_profiler():
+    profiler = MemoryProfiler(enabled=False)
+
+    with profiler.measure('parse'):
+        pass
+
+    assert profiler.records == []
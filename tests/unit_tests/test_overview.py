@@ -0,0 +1,82 @@
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plugin.presentation.windows.aggregates import FrameAggregates
+from plugin.presentation.windows.overview import Thumbnail, ThumbnailRenderer, calculate_metrics, render_thumbnail
+
+
+@pytest.fixture
+def aggregates() -> FrameAggregates:
+    concentration = np.repeat([.1, 1, 10], 2)
+    intensity_true = 100 * concentration
+    intensity_linearized = intensity_true * np.array([1.01, .99, 1.02, 1.02, .96, .96])
+
+    frame = pd.DataFrame(
+        {
+            'concentration': concentration,
+            'intensity': intensity_true * .9,
+            'intensity_true': intensity_true,
+            'intensity_linearized': intensity_linearized,
+        },
+        index=pd.MultiIndex.from_product([[0, 1, 2], [0, 1]]),
+    )
+    return FrameAggregates.create(frame)
+
+
+def test_calculate_metrics(aggregates):
+    metrics = calculate_metrics(aggregates)
+
+    assert metrics['n_probes'] == 3
+    assert metrics['max'] == pytest.approx(4)
+    assert metrics['rms'] == pytest.approx(np.sqrt((0**2 + 2**2 + 4**2) / 3))
+
+
+def test_render_thumbnail(aggregates):
+    png = render_thumbnail(aggregates, bounds=(10, 1000))
+
+    assert png.startswith(b'\x89PNG')
+
+
+@pytest.fixture
+def renderer() -> ThumbnailRenderer:
+    renderer = ThumbnailRenderer()
+    yield renderer
+    renderer.shutdown()
+
+
+def create_future(thumbnail: Thumbnail | None = None) -> Future:
+    future = Future()
+    if thumbnail is None:
+        future.cancel()
+    else:
+        future.set_result(thumbnail)
+
+    return future
+
+
+def test_renderer_emit(renderer):
+    emitted = []
+    renderer.rendered.connect(lambda *args: emitted.append(args))
+
+    thumbnail = Thumbnail(png=b'', metrics={})
+    renderer._expected['0'] = ('0', None)
+    renderer._done(('0', (1, 2)), create_future(thumbnail))  # outdated
+    renderer._done(('0', None), create_future())  # cancelled
+    renderer._done(('0', None), create_future(thumbnail))
+
+    assert emitted == [('0', thumbnail)]
+
+
+def test_renderer_closed(renderer):
+    emitted = []
+    renderer.rendered.connect(lambda *args: emitted.append(args))
+
+    renderer._expected['0'] = ('0', None)
+    renderer.shutdown()
+    renderer._done(('0', None), create_future(Thumbnail(png=b'', metrics={})))
+
+    assert renderer.closed
+    assert emitted == []
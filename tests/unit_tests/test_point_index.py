@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from plugin.presentation.windows.point_index import PointIndex
+
+
+def find_nearest(xy: np.ndarray, x: float, y: float, radius: float) -> int | None:
+    distance = np.hypot(xy[:, 0] - x, xy[:, 1] - y)
+    distance[np.isnan(distance)] = np.inf
+
+    i = np.argmin(distance)
+    if distance[i] > radius:
+        return None
+    return int(i)
+
+
+@pytest.mark.parametrize('cell_size', [1, 8, 100])
+def test_point_index_query(
+    cell_size: float,
+):
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(0, 480, size=(1000, 2))
+    xy[::13] = np.nan
+
+    index = PointIndex(xy, cell_size=cell_size)
+    assert len(index) == len(xy) - len(xy[::13])
+
+    for x, y in rng.uniform(-10, 490, size=(200, 2)):
+        assert index.query(x, y, radius=8) == find_nearest(xy, x, y, radius=8)
+
+
+def test_point_index_tie():
+    xy = [(10, 10), (20, 10), (0, 10), (15, 10)]
+    index = PointIndex(xy, cell_size=8)
+
+    assert index.query(15, 10, radius=8) == 3
+    assert index.query(5, 10, radius=8) == 0  # (0, 10) and (10, 10) are equidistant
+
+
+def test_point_index_empty():
+    index = PointIndex(np.empty((0, 2)), cell_size=8)
+
+    assert len(index) == 0
+    assert index.query(0, 0, radius=8) is None
+
+
+def test_point_index_out_of_radius():
+    index = PointIndex([(0, 0)], cell_size=8)
+
+    assert index.query(5, 0, radius=8) == 0
+    assert index.query(9, 0, radius=8) is None
+    assert index.query(8, 8, radius=8) is None
+
+
+def test_point_index_log_scale():
+    """Points of log-scale axis are indexed in display coordinates (nearest in log, not in data, space)."""
+
+    x = np.array([1, 10, 100])
+    xy = np.column_stack([100 * np.log10(x), np.zeros(3)])  # as `ax.transData.transform` of log-scale axis
+    index = PointIndex(xy, cell_size=8)
+
+    assert index.query(100 * np.log10(40), 0, radius=100) == 2  # 40 is nearer to 10 in data space
+    assert index.query(100 * np.log10(20), 0, radius=100) == 1
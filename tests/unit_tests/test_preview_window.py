@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.patches import Rectangle
+
+from plugin.presentation.windows.aggregates import FrameAggregates
+from plugin.presentation.windows.preview_window import RetriverViewWidget
+
+
+def create_aggregates(scale: float = 1) -> FrameAggregates:
+    concentration = np.repeat([.1, 1, 10], 2)
+    intensity_true = 100 * concentration * scale
+
+    frame = pd.DataFrame(
+        {
+            'concentration': concentration,
+            'intensity': intensity_true * .9,
+            'intensity_true': intensity_true,
+            'intensity_linearized': intensity_true * 1.01,
+        },
+        index=pd.MultiIndex.from_product([['Sample0', 'Sample1', 'Sample2'], ['p1', 'p2']]),
+    )
+    return FrameAggregates.create(frame)
+
+
+@pytest.fixture
+def widget(qtbot) -> RetriverViewWidget:
+    widget = RetriverViewWidget(column_id='1')
+    qtbot.addWidget(widget)
+
+    return widget
+
+
+def test_update_reuses_artists(widget):
+    ax = widget.canvas.axes
+
+    widget.update(create_aggregates(), bounds=(10, 100))
+    artists = dict(widget._artists)
+    n_artists = len(ax.get_children())
+    assert artists['bounds'].get_visible()
+
+    widget.update(create_aggregates(scale=2), bounds=None)
+    assert all(widget._artists[name] is artist for name, artist in artists.items())
+    assert len(ax.get_children()) == n_artists
+    assert not artists['bounds'].get_visible()
+    assert artists['intensity_mean'].get_offsets()[:, 1].tolist() == pytest.approx([18, 180, 1800])
+
+
+def test_update_autoscale(widget):
+    ax = widget.canvas.axes
+
+    widget.update(create_aggregates(), bounds=None)
+    ylim = ax.get_ylim()
+
+    # the same data lims
+    ax.set_ylim(1, 2, auto=True)
+    widget.update(create_aggregates(), bounds=None)
+    assert ax.get_ylim() == (1, 2)
+
+    # changed data lims
+    widget.update(create_aggregates(scale=10), bounds=None)
+    assert ax.get_ylim()[1] > ylim[1]
+
+
+def test_update_keeps_zoom(widget):
+    ax = widget.canvas.axes
+    widget.update(create_aggregates(), bounds=None)
+
+    lims = ((.5, 2), (50, 200))
+    widget.set_cropped_lims(lims)
+    widget.update_zoom(lims)
+
+    widget.update(create_aggregates(scale=10), bounds=None)
+    assert ax.get_xlim() == (.5, 2)
+    assert ax.get_ylim() == (50, 200)
+
+
+def test_blit(widget, monkeypatch):
+    ax = widget.canvas.axes
+    widget.update(create_aggregates(), bounds=None)
+
+    region = Rectangle((.5, 50), 0, 0, fill=False)
+    ax.add_patch(region)
+    widget.start_blit(region)
+    assert region.get_animated()
+    assert widget._background is not None  # cached by `draw_event` of the full draw
+
+    # only the blitted artist is redrawn over the cached background
+    draws = []
+    monkeypatch.setattr(widget.canvas, 'draw', lambda: draws.append('draw'))
+    monkeypatch.setattr(widget.canvas, 'draw_idle', lambda: draws.append('draw_idle'))
+    monkeypatch.setattr(widget.figure, 'draw_artist', lambda artist: draws.append(artist))
+
+    region.set_width(1)
+    widget.blit()
+    assert draws == [region]
+
+    widget.stop_blit()
+    assert region not in ax.patches
+    assert widget._background is None
+    assert draws[-1] == 'draw_idle'
+
+
+def test_blit_without_background(widget, monkeypatch):
+    widget.update(create_aggregates(), bounds=None)
+
+    draws = []
+    monkeypatch.setattr(widget.canvas, 'draw_idle', lambda: draws.append('draw_idle'))
+
+    widget.blit()  # nothing is cached yet, so full redraw is requested
+    assert draws == ['draw_idle']
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plugin.managers.correction_manager.core import process_data
+from spectrumlab.peaks.analyte_peaks.intensity.transformers import (
+    RegressionIntensityTransformer,
+    estimate_bounds,
+    process_frame,
+)
+
+
+@pytest.fixture(scope='module')
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+
+    data = []
+    for i, concentration in enumerate(np.logspace(-3, 1, 12)):
+        for j in range(3):
+            intensity = 20 * (1 - np.exp(-concentration)) * (1 + .01*rng.normal())
+            data.append({
+                'probe_name': str(i),
+                'parallel_name': str(j),
+                'concentration': concentration,
+                'intensity': intensity,
+            })
+
+    return pd.DataFrame(data).set_index(['probe_name', 'parallel_name'])
+
+
+@pytest.fixture(scope='module')
+def transformer(frame: pd.DataFrame) -> RegressionIntensityTransformer:
+    data = process_frame(frame)
+
+    return RegressionIntensityTransformer.create(
+        data=data,
+        bounds=estimate_bounds(data),
+    )
+
+
+def test_apply(frame, transformer):
+    x = frame['intensity'].to_numpy()
+
+    assert np.allclose(
+        transformer.apply(x),
+        [transformer(value) for value in x],
+        equal_nan=True,
+    )
+
+
+def test_process_data(frame, transformer):
+    data = process_data(frame, transformer=transformer)
+
+    # per-value path (before vectorization)
+    expected = pd.DataFrame(
+        [
+            {
+                'probe': i,
+                'parallel': j,
+                'concentration': frame.loc[(i, j), 'concentration'],
+                'intensity': frame.loc[(i, j), 'intensity'],
+                'intensity_true': transformer.estimate_intensity(frame.loc[(i, j), 'concentration']),
+                'intensity_linearized': transformer(frame.loc[(i, j), 'intensity']),
+            }
+            for i, j in frame.index
+        ],
+        columns=['probe', 'parallel', 'concentration', 'intensity', 'intensity_true', 'intensity_linearized'],
+    ).set_index(['probe', 'parallel']).sort_values(by='concentration')
+
+    pd.testing.assert_frame_equal(data, expected, check_dtype=False)
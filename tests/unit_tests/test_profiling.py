@@ -0,0 +1,82 @@
+import pstats
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from plugin.config import ProfileMode
+from plugin.diagnostics.profiling import Profiler, hash_file
+
+
+def busy(duration: float) -> None:
+    started_at = time.perf_counter()
+    while time.perf_counter() - started_at < duration:
+        pass
+
+
+@pytest.mark.parametrize('mode', [ProfileMode.CPROFILE, ProfileMode.SAMPLING])
+def test_profiler(mode, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    filepath = tmp_path / 'py_table.xml'
+    filepath.write_text('<root/>')
+
+    profiler = Profiler(mode=mode, interval=.001)
+    with profiler.profile() as profile:
+        profile.filepath = str(filepath)
+        busy(.05)
+
+    filepaths = list(tmp_path.glob('profile_{}_*'.format(hash_file(str(filepath)))))
+    assert len(filepaths) == 1
+
+    match mode:
+        case ProfileMode.CPROFILE:
+            assert any(name == 'busy' for *_, name in pstats.Stats(str(filepaths[0])).stats)
+        case ProfileMode.SAMPLING:
+            assert 'busy (test_profiling.py' in filepaths[0].read_text()
+
+
+@pytest.mark.parametrize('mode', [ProfileMode.CPROFILE, ProfileMode.SAMPLING])
+def test_profiler_threads(mode, tmp_path, monkeypatch):
+    """Other threads (as `report-manager` one dumping the report) are profiled too."""
+
+    def dump(duration: float) -> None:
+        busy(duration)
+
+    monkeypatch.chdir(tmp_path)
+
+    profiler = Profiler(mode=mode, interval=.001)
+    with profiler.profile():
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='report-manager') as executor:
+            executor.submit(dump, .05).result()
+
+    filepath, = tmp_path.glob('profile_unknown_*')
+    match mode:
+        case ProfileMode.CPROFILE:
+            assert any(name == 'dump' for *_, name in pstats.Stats(str(filepath)).stats)
+        case ProfileMode.SAMPLING:
+            assert any(
+                stack.startswith('report-manager') and 'dump (test_profiling.py' in stack
+                for stack in filepath.read_text().splitlines()
+            )
+
+
+def test_profiler_pause(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    profiler = Profiler(mode=ProfileMode.SAMPLING, interval=.001)
+    with profiler.profile() as profile:
+        with profiler.pause_event_loop():
+            busy(.05)
+
+    assert not profile.collector.stacks
+    assert list(tmp_path.glob('profile_unknown_*.collapsed'))
+
+
+def test_disabled_profiler(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    profiler = Profiler(mode=ProfileMode.NONE)
+    with profiler.profile(), profiler.pause_event_loop():
+        pass
+
+    assert not list(tmp_path.iterdir())
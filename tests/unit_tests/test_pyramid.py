@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from plugin.presentation.windows.pyramid import Pyramid
+
+
+@pytest.mark.parametrize('n_samples', [2, 1000, 100_003])
+def test_pyramid_envelope(
+    n_samples: int,
+):
+    values = np.random.default_rng(0).normal(size=n_samples)
+    values[::7] = np.nan
+
+    pyramid = Pyramid.create(values)
+    assert len(pyramid) == n_samples
+    assert len(pyramid.lower[-1]) == 1
+
+    for level in range(pyramid.n_levels):
+        x, y = pyramid.query(0, n_samples, level=level)
+        assert np.all(np.diff(x) >= 0)
+        assert np.nanmin(y) == np.nanmin(values)
+        assert np.nanmax(y) == np.nanmax(values)
+
+
+def test_pyramid_select_level():
+    pyramid = Pyramid.create(np.zeros(100_000), factor=4)
+
+    assert pyramid.select_level(span=100, n_pixels=800) == 0
+    assert pyramid.select_level(span=100_000, n_pixels=800) == 3
+    assert pyramid.select_level(span=1e12, n_pixels=800) == pyramid.n_levels - 1
+
+    x, y = pyramid.query(0, 100_000, level=3)
+    assert 800 <= len(x) // 2 < 4*800
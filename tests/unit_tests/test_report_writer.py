@@ -0,0 +1,116 @@
+import xml.etree.ElementTree as ElementTree
+from io import StringIO
+from xml.dom import minidom
+
+import numpy as np
+import pytest
+
+from plugin.managers.data_manager.parsers.atom_table_parser import numpy_array_from_b64, parse_compact_polynom
+from plugin.managers.report_manager.writer import write_messages, write_report
+
+
+def wrap_minidom(columns) -> str:
+    root = ElementTree.Element('columns')
+
+    for datum in columns:
+        column = ElementTree.SubElement(root, 'column', id=datum['id'], nickname=datum['nickname'])
+
+        ElementTree.SubElement(column, 'bounds', **datum['bounds'])
+
+        polynom = ElementTree.SubElement(column, 'polynom')
+        for x, y in zip(*datum['polynom']):
+            ElementTree.SubElement(polynom, 'point', x=str(x), y=str(y))
+
+    reparsed = minidom.parseString(
+        string=ElementTree.tostring(root, encoding='utf-8'),
+    )
+    return reparsed.toprettyxml(indent='', encoding='utf-8').decode('utf-8')
+
+
+@pytest.mark.parametrize('n_points', [0, 1, 100])
+def test_write_report(
+    column_id: str,
+    column_name: str,
+    n_points: int,
+):
+    columns = [
+        dict(
+            id=column_id,
+            nickname=column_name,
+            bounds={'lb': str(.0063353106), 'ub': str(.023939835)},
+            polynom=(np.logspace(-6, 6, n_points), np.logspace(-6, 6, n_points)**1.1),
+        ),
+        dict(
+            id='<&>',
+            nickname='"nickname"',
+            bounds={'lb': '0', 'ub': '1'},
+            polynom=(np.array([1e-5, 1e16, 3]), np.array([.1 + .2, np.nan, 0])),
+        ),
+    ]
+
+    buffer = StringIO()
+    write_report(buffer, columns=columns)
+
+    assert buffer.getvalue() == wrap_minidom(columns)
+
+
+def test_write_empty_report():
+    buffer = StringIO()
+    write_report(buffer, columns=[])
+
+    assert buffer.getvalue() == wrap_minidom([])
+
+
+def test_write_messages():
+    buffer = StringIO()
+    write_messages(buffer, messages=['Absorption correction failed!'])
+
+    root = ElementTree.fromstring(buffer.getvalue())
+    assert root.find('message').get('text') == 'Absorption correction failed!'
+
+
+def test_write_compact_report(
+    column_id: str,
+    column_name: str,
+):
+    x, y = np.logspace(-6, 6, 100), np.logspace(-6, 6, 100)**1.1
+    columns = [
+        dict(
+            id=column_id,
+            nickname=column_name,
+            bounds={'lb': '0', 'ub': '1'},
+            polynom=(x, y),
+        ),
+    ]
+
+    buffer = StringIO()
+    write_report(buffer, columns=columns, compact=True)
+
+    root = ElementTree.fromstring(buffer.getvalue())
+    __polynom = root.find('column/polynom')
+    assert __polynom.get('encoding') == 'base64'
+    assert np.array_equal(numpy_array_from_b64(__polynom.find('xvals').text, dtype=__polynom.get('dtype')), x)
+    assert np.array_equal(numpy_array_from_b64(__polynom.find('yvals').text, dtype=__polynom.get('dtype')), y)
+
+
+@pytest.mark.parametrize('n_points', [0, 1, 100])
+def test_compact_polynom_round_trip(
+    n_points: int,
+):
+    x, y = np.logspace(-6, 6, n_points), np.logspace(-6, 6, n_points)**1.1
+    y[:n_points // 2] = np.nan
+
+    columns = [
+        dict(
+            id='1',
+            nickname='Ag 338.289',
+            bounds={'lb': '0', 'ub': '1'},
+            polynom=(x, y),
+        ),
+    ]
+
+    buffer = StringIO()
+    write_report(buffer, columns=columns, compact=True)
+
+    polynom = parse_compact_polynom(ElementTree.fromstring(buffer.getvalue()).find('column/polynom'))
+    assert np.array_equal(np.array(polynom).reshape(-1, 2), np.stack([x, y], axis=1), equal_nan=True)
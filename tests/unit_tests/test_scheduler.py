@@ -0,0 +1,128 @@
+from collections.abc import Callable
+
+import pytest
+
+from plugin.presentation.scheduler import RedrawScheduler
+
+
+class FakeSignal:
+
+    def __init__(self) -> None:
+        self.slots = []
+
+    def connect(self, slot: Callable[[], None]) -> None:
+        self.slots.append(slot)
+
+    def emit(self) -> None:
+        for slot in self.slots:
+            slot()
+
+
+class FakeTimer:
+    """Repeating timer driven by `FakeClock`."""
+
+    def __init__(self, clock: 'FakeClock') -> None:
+        self.clock = clock
+        self.clock.timers.append(self)
+
+        self.timeout = FakeSignal()
+        self.interval = 0
+        self.deadline = None
+
+    def setInterval(self, interval: int) -> None:  # noqa: N802
+        self.interval = interval
+
+    def isActive(self) -> bool:  # noqa: N802
+        return self.deadline is not None
+
+    def start(self) -> None:
+        self.deadline = self.clock.time + self.interval
+
+    def stop(self) -> None:
+        self.deadline = None
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.time = 0  # in ms
+        self.timers = []
+
+    def advance(self, duration: int) -> None:
+        """Advance time by `duration` (in ms) and fire due timers."""
+
+        stop = self.time + duration
+        while True:
+            timers = [timer for timer in self.timers if timer.isActive() and timer.deadline <= stop]
+            if not timers:
+                break
+
+            timer = min(timers, key=lambda timer: timer.deadline)
+            self.time = timer.deadline
+            timer.deadline += timer.interval
+            timer.timeout.emit()
+
+        self.time = stop
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock: FakeClock) -> RedrawScheduler:
+    return RedrawScheduler(fps=50, timer=FakeTimer(clock))
+
+
+def test_scheduler_coalesce(clock, scheduler):
+    handled = []
+
+    for i in range(10):
+        scheduler.schedule('owner', 'hover', lambda i=i: handled.append(('hover', i)))
+    scheduler.schedule('owner', 'pan', lambda: handled.append(('pan', 0)))
+    scheduler.schedule('other', 'hover', lambda: handled.append(('other', 0)))
+    assert handled == []
+
+    clock.advance(20)
+    assert handled == [('hover', 9), ('pan', 0), ('other', 0)]
+    assert scheduler.stats() == {'scheduled': 12, 'coalesced': 9, 'dropped': 0, 'executed': 3}
+
+
+def test_scheduler_throttle(clock, scheduler):
+    handled = []
+
+    # 1000 events per second during 1 s
+    for t in range(1000):
+        scheduler.schedule('owner', 'hover', lambda t=t: handled.append(clock.time))
+        clock.advance(1)
+
+    assert len(handled) == 50
+    assert all(b - a >= 20 for a, b in zip(handled, handled[1:]))
+
+
+def test_scheduler_stop_when_idle(clock, scheduler):
+    scheduler.schedule('owner', 'hover', lambda: None)
+    assert scheduler._timer.isActive()
+
+    clock.advance(20)
+    assert scheduler._timer.isActive()  # stopped at the next (empty) tick
+    clock.advance(20)
+    assert not scheduler._timer.isActive()
+
+    scheduler.schedule('owner', 'hover', lambda: None)
+    assert scheduler._timer.isActive()
+
+
+def test_scheduler_cancel(clock, scheduler):
+    handled = []
+    owner = object()
+
+    scheduler.schedule(owner, 'hover', lambda: handled.append('owner'))
+    scheduler.schedule(owner, 'pan', lambda: handled.append('owner'))
+    scheduler.schedule('other', 'hover', lambda: handled.append('other'))
+    scheduler.cancel(owner)
+
+    clock.advance(20)
+    assert handled == ['other']
+    assert scheduler.stats()['dropped'] == 2
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from plugin.managers.report_manager.simplification import simplify_polynom
+
+
+class Transformer:
+
+    def apply(self, values):
+        values = np.asarray(values, dtype=float)
+        return values * (1 + .3*values**1.5)
+
+
+@pytest.mark.parametrize('tolerance', [1e-2, 1e-3])
+def test_simplify_polynom(
+    tolerance: float,
+):
+    transformer = Transformer()
+
+    x = np.linspace(1, 20, 200)
+    y = transformer.apply(x)
+    x_hat, y_hat = simplify_polynom(
+        x[::-1], y[::-1],
+        transformer=transformer,
+        tolerance=tolerance,
+    )
+    assert 2 < len(x_hat) < len(x)
+    assert x_hat[0] == x[0] and x_hat[-1] == x[-1]
+    assert np.all(np.diff(x_hat) > 0)
+
+    x = np.linspace(1, 20, 10001)
+    y = transformer.apply(x)
+    error = np.abs(np.interp(x, x_hat, y_hat) - y) / y
+    assert np.all(error <= tolerance)
+
+
+def test_simplify_linear_polynom():
+    x = np.linspace(1, 10, 10)
+
+    x_hat, y_hat = simplify_polynom(
+        x, 2*x,
+        transformer=type('Linear', (), {'apply': lambda self, values: 2*np.asarray(values)})(),
+        tolerance=1e-6,
+    )
+    assert np.array_equal(x_hat, [1, 10])
+    assert np.array_equal(y_hat, [2, 20])
+
+
+def test_simplify_not_verified_polynom():
+
+    class Transformer:
+        """Transformer drifting after the first call (simplification is not reproduced by verification)."""
+
+        def __init__(self) -> None:
+            self.n_calls = 0
+
+        def apply(self, values):
+            values = np.asarray(values, dtype=float)
+            self.n_calls += 1
+            return values**2 if self.n_calls == 1 else .5*values**2
+
+    x = np.linspace(1, 10, 100)
+
+    x_hat, y_hat = simplify_polynom(
+        x, x**2,
+        transformer=Transformer(),
+        tolerance=1e-2,
+    )
+    assert np.array_equal(x_hat, x)
+    assert np.array_equal(y_hat, x**2)
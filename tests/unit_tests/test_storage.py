@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from plugin.managers.report_manager.storage import archive, rotate, write_atomic
+
+
+def test_write_atomic(tmp_path):
+    filepath = tmp_path / 'results.xml'
+
+    write_atomic(filepath, '<report>1</report>')
+    write_atomic(filepath, '<report>2</report>')
+
+    assert filepath.read_text(encoding='utf-8') == '<report>2</report>'
+    assert os.listdir(tmp_path) == ['results.xml']
+
+
+def test_write_atomic_failed(tmp_path):
+    filepath = tmp_path / 'results.xml'
+    write_atomic(filepath, '<report>1</report>')
+
+    with pytest.raises(TypeError):
+        write_atomic(filepath, None)
+
+    assert filepath.read_text(encoding='utf-8') == '<report>1</report>'
+    assert os.listdir(tmp_path) == ['results.xml']
+
+
+def test_archive(tmp_path):
+    filepath = tmp_path / 'results.xml'
+    directory = tmp_path / 'history'
+
+    paths = [
+        archive(filepath, '<report>{}</report>'.format(i), directory=directory, max_size=60)
+        for i in range(10)
+    ]
+
+    assert sorted(directory.iterdir()) == paths[-3:]
+    assert paths[-1].read_text(encoding='utf-8') == '<report>9</report>'
+
+
+def test_rotate(tmp_path):
+    for i, size in enumerate([10, 10, 100]):
+        (tmp_path / 'results-{}.xml'.format(i)).write_text('x' * size)
+    (tmp_path / 'other.xml').write_text('x' * 1000)
+
+    rotate(tmp_path, pattern='results-*.xml', max_size=50)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['other.xml', 'results-2.xml']  # the newest is kept
@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from plugin.diagnostics.tracing import NULL_SPAN, Tracer
+
+
+def test_tracer_export(tmp_path):
+    tracer = Tracer(enabled=True)
+
+    with tracer.span('run'):
+        with tracer.span('parse', n_bytes=10) as span:
+            span.set_attributes(n_rows=2)
+        with pytest.raises(ValueError):
+            with tracer.span('fit', column_id='1'):
+                raise ValueError
+
+    filepath = tmp_path / 'trace.json'
+    tracer.export(filepath)
+    events = {event['name']: event for event in json.loads(filepath.read_text())['traceEvents']}
+
+    assert set(events) == {'run', 'parse', 'fit'}
+    assert events['parse']['args'] == {'n_bytes': 10, 'n_rows': 2}
+    assert 'error' in events['fit']['args']
+    assert events['run']['ts'] <= events['parse']['ts']
+    assert events['parse']['ts'] + events['parse']['dur'] <= events['run']['ts'] + events['run']['dur']
+    assert set(tracer.durations()) == {'run', 'parse', 'fit'}
+
+
+def test_disabled_tracer():
+    tracer = Tracer(enabled=False)
+
+    with tracer.span('run') as span:
+        span.set_attributes(n_rows=2)
+
+    assert span is NULL_SPAN
+    assert tracer.spans == []
+
+
+def test_tracer_reset():
+    tracer = Tracer(enabled=True)
+
+    with tracer.span('run'):
+        pass
+    tracer.reset()
+    with tracer.span('run'):
+        pass
+
+    assert len(tracer.spans) == 1
+    assert set(tracer.durations()) == {'run'}